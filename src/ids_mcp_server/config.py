@@ -1,8 +1,9 @@
 """Configuration management for IDS MCP Server."""
 
 import os
+from functools import lru_cache
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ServerConfig(BaseModel):
@@ -23,6 +24,8 @@ class SessionConfig(BaseModel):
 class AuditToolConfig(BaseModel):
     """IDS-Audit-tool configuration."""
 
+    model_config = ConfigDict(frozen=True)  # Hashable, used as a cache key
+
     enabled: bool = True
     path: Optional[str] = None  # Auto-detect if None
 
@@ -35,10 +38,26 @@ class IDSMCPConfig(BaseModel):
     audit_tool: AuditToolConfig = Field(default_factory=AuditToolConfig)
 
 
+# Environment variables read by load_config_from_env
+_ENV_KEYS = (
+    "IDS_LOG_LEVEL",
+    "IDS_MASK_ERRORS",
+    "IDS_SESSION_TIMEOUT",
+    "IDS_CLEANUP_INTERVAL",
+    "IDS_AUDIT_TOOL_ENABLED",
+    "IDS_AUDIT_TOOL_PATH",
+)
+
+
+@lru_cache(maxsize=1)
 def load_config_from_env() -> IDSMCPConfig:
     """
     Load configuration from environment variables.
 
+    The environment is read once per process and the resulting config is
+    cached. Call ``load_config_from_env.cache_clear()`` to pick up changes
+    made after the first call (e.g. in tests).
+
     Environment Variables:
         IDS_LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR)
         IDS_MASK_ERRORS: Mask error details (true/false)
@@ -50,19 +69,21 @@ def load_config_from_env() -> IDSMCPConfig:
     Returns:
         IDSMCPConfig: Configuration object
     """
+    env = {key: os.environ[key] for key in _ENV_KEYS if key in os.environ}
+
     server_config = ServerConfig(
-        log_level=os.getenv("IDS_LOG_LEVEL", "INFO"),
-        mask_error_details=os.getenv("IDS_MASK_ERRORS", "false").lower() == "true"
+        log_level=env.get("IDS_LOG_LEVEL", "INFO"),
+        mask_error_details=env.get("IDS_MASK_ERRORS", "false").lower() == "true"
     )
 
     session_config = SessionConfig(
-        session_timeout=int(os.getenv("IDS_SESSION_TIMEOUT", "86400")),
-        cleanup_interval=int(os.getenv("IDS_CLEANUP_INTERVAL", "3600"))
+        session_timeout=int(env.get("IDS_SESSION_TIMEOUT", "86400")),
+        cleanup_interval=int(env.get("IDS_CLEANUP_INTERVAL", "3600"))
     )
 
     audit_tool_config = AuditToolConfig(
-        enabled=os.getenv("IDS_AUDIT_TOOL_ENABLED", "true").lower() == "true",
-        path=os.getenv("IDS_AUDIT_TOOL_PATH", None)
+        enabled=env.get("IDS_AUDIT_TOOL_ENABLED", "true").lower() == "true",
+        path=env.get("IDS_AUDIT_TOOL_PATH")
     )
 
     return IDSMCPConfig(
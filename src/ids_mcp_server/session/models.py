@@ -20,8 +20,13 @@ class SessionData:
 
     Note: We don't use Pydantic here because ids.Ids is from IfcTester
     and we want to store it directly without wrapping.
+
+    Attributes are fixed via __slots__ so instances carry no per-instance
+    __dict__; SessionMetadata stays a Pydantic model and keeps its own.
     """
 
+    __slots__ = ("metadata", "ids_obj")
+
     def __init__(self, session_id: str):
         """
         Initialize session data.
@@ -1,9 +1,17 @@
 """Thread-safe session storage."""
 
 import threading
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 from ids_mcp_server.session.models import SessionData
 
+# Number of storage shards (must be a power of two)
+_SHARD_COUNT = 16
+
+
+def _shard_index(session_id: str) -> int:
+    """Return the index of the shard responsible for a session."""
+    return hash(session_id) & (_SHARD_COUNT - 1)
+
 
 class SessionStorage:
     """
@@ -11,25 +19,34 @@ class SessionStorage:
 
     This class provides thread-safe operations for storing and retrieving
     session data across multiple concurrent requests.
+
+    Sessions are spread over a fixed number of shards, each guarded by its
+    own lock, so concurrent writers to different sessions rarely contend.
     """
 
     def __init__(self):
-        """Initialize empty storage with thread lock."""
-        self._storage: Dict[str, SessionData] = {}
-        self._lock = threading.Lock()
+        """Initialize empty storage shards, each with its own lock."""
+        self._shards: List[Tuple[Dict[str, SessionData], threading.Lock]] = [
+            ({}, threading.Lock()) for _ in range(_SHARD_COUNT)
+        ]
+
+    def _shard_for(self, session_id: str) -> Tuple[Dict[str, SessionData], threading.Lock]:
+        """Return the (data, lock) shard responsible for a session."""
+        return self._shards[_shard_index(session_id)]
 
     def get(self, session_id: str) -> Optional[SessionData]:
         """
         Get session data (thread-safe).
 
+        Reads are lock-free: a single dict lookup is atomic in CPython.
+
         Args:
             session_id: Session identifier
 
         Returns:
             SessionData if found, None otherwise
         """
-        with self._lock:
-            return self._storage.get(session_id)
+        return self._shard_for(session_id)[0].get(session_id)
 
     def set(self, session_id: str, data: SessionData) -> None:
         """
@@ -39,8 +56,27 @@ class SessionStorage:
             session_id: Session identifier
             data: Session data to store
         """
-        with self._lock:
-            self._storage[session_id] = data
+        shard, lock = self._shard_for(session_id)
+        with lock:
+            shard[session_id] = data
+
+    def set_many(self, items: Iterable[Tuple[str, SessionData]]) -> None:
+        """
+        Set several sessions at once (thread-safe).
+
+        Items are grouped by shard so each shard lock is taken at most once.
+
+        Args:
+            items: (session_id, data) pairs to store
+        """
+        groups: Dict[int, Dict[str, SessionData]] = {}
+        for session_id, data in items:
+            groups.setdefault(_shard_index(session_id), {})[session_id] = data
+
+        for index, group in groups.items():
+            shard, lock = self._shards[index]
+            with lock:
+                shard.update(group)
 
     def delete(self, session_id: str) -> None:
         """
@@ -49,9 +85,34 @@ class SessionStorage:
         Args:
             session_id: Session to remove
         """
-        with self._lock:
-            if session_id in self._storage:
-                del self._storage[session_id]
+        shard, lock = self._shard_for(session_id)
+        with lock:
+            shard.pop(session_id, None)
+
+    def contains(self, session_id: str) -> bool:
+        """
+        Check whether a session exists (lock-free, like get).
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session is stored
+        """
+        return session_id in self._shard_for(session_id)[0]
+
+    def session_count(self) -> int:
+        """
+        Get the number of active sessions.
+
+        Returns:
+            Number of stored sessions
+        """
+        count = 0
+        for shard, lock in self._shards:
+            with lock:
+                count += len(shard)
+        return count
 
     def get_all_session_ids(self) -> List[str]:
         """
@@ -60,13 +121,17 @@ class SessionStorage:
         Returns:
             List of session IDs
         """
-        with self._lock:
-            return list(self._storage.keys())
+        session_ids: List[str] = []
+        for shard, lock in self._shards:
+            with lock:
+                session_ids.extend(shard.keys())
+        return session_ids
 
     def clear(self) -> None:
         """Clear all sessions (useful for testing)."""
-        with self._lock:
-            self._storage.clear()
+        for shard, lock in self._shards:
+            with lock:
+                shard.clear()
 
 
 # Global session storage instance
@@ -13,6 +13,23 @@ from ids_mcp_server.session.manager import (
 )
 from ids_mcp_server.session.storage import get_session_storage
 
+# Accepted values for load_ids(source_type=...)
+_VALID_SOURCE_TYPES = frozenset({"file", "string"})
+
+
+def _validate_ids_xml(source: str) -> None:
+    """
+    Validate IDS XML against the XSD without building an IDS object.
+
+    Args:
+        source: XML string or path to an IDS file
+
+    Raises:
+        Exception: If the document does not conform to the schema
+    """
+    # IfcTester compiles the schema on first use and keeps it in a module global
+    ids.get_schema().validate(source)
+
 
 async def create_ids(
     title: str,
@@ -109,28 +126,30 @@ async def load_ids(
             "specifications": [...]
         }
     """
+    if source_type not in _VALID_SOURCE_TYPES:
+        raise ToolError(f"Invalid source_type: {source_type}. Must be 'file' or 'string'")
+
     try:
         if source_type == "file":
             ids_obj = await create_session_from_file(ctx, source)
-        elif source_type == "string":
-            ids_obj = await create_session_from_string(ctx, source)
         else:
-            raise ToolError(f"Invalid source_type: {source_type}. Must be 'file' or 'string'")
+            ids_obj = await create_session_from_string(ctx, source)
 
-        # Build specification summary
-        spec_list = []
-        for spec in ids_obj.specifications:
-            spec_list.append({
+        # Build specification summary in a single pass
+        spec_list = [
+            {
                 "name": spec.name,
-                "identifier": getattr(spec, 'identifier', None),
-                "ifc_versions": spec.ifcVersion if hasattr(spec, 'ifcVersion') else []
-            })
+                "identifier": spec.identifier,
+                "ifc_versions": spec.ifcVersion
+            }
+            for spec in ids_obj.specifications
+        ]
 
         return {
             "status": "loaded",
             "title": ids_obj.info.get("title", "Untitled"),
             "author": ids_obj.info.get("author"),
-            "specification_count": len(ids_obj.specifications),
+            "specification_count": len(spec_list),
             "specifications": spec_list
         }
 
@@ -181,7 +200,7 @@ async def export_ids(
             # Validate if requested
             if validate:
                 try:
-                    validated_ids = ids.open(output_path, validate=True)
+                    _validate_ids_xml(output_path)
                     validation_result["valid"] = True
                 except Exception as e:
                     validation_result["valid"] = False
@@ -201,7 +220,7 @@ async def export_ids(
             # Validate if requested
             if validate:
                 try:
-                    validated_ids = ids.from_string(xml_string, validate=True)
+                    _validate_ids_xml(xml_string)
                     validation_result["valid"] = True
                 except Exception as e:
                     validation_result["valid"] = False
@@ -241,23 +260,25 @@ async def get_ids_info(ctx: Context) -> Dict[str, Any]:
         # Get IDS from session
         ids_obj = await get_or_create_session(ctx)
 
-        # Build specification summary
-        spec_list = []
-        for spec in ids_obj.specifications:
-            spec_list.append({
-                "identifier": getattr(spec, 'identifier', None),
+        # Build specification summary in a single pass
+        spec_list = [
+            {
+                "identifier": spec.identifier,
                 "name": spec.name,
-                "ifc_versions": spec.ifcVersion if hasattr(spec, 'ifcVersion') else [],
-                "applicability_facets": len(spec.applicability) if hasattr(spec, 'applicability') else 0,
-                "requirement_facets": len(spec.requirements) if hasattr(spec, 'requirements') else 0
-            })
+                "ifc_versions": spec.ifcVersion,
+                "applicability_facets": len(spec.applicability),
+                "requirement_facets": len(spec.requirements)
+            }
+            for spec in ids_obj.specifications
+        ]
 
+        info = ids_obj.info
         return {
-            "title": ids_obj.info.get("title"),
-            "author": ids_obj.info.get("author"),
-            "version": ids_obj.info.get("version"),
-            "description": ids_obj.info.get("description"),
-            "specification_count": len(ids_obj.specifications),
+            "title": info.get("title"),
+            "author": info.get("author"),
+            "version": info.get("version"),
+            "description": info.get("description"),
+            "specification_count": len(spec_list),
             "specifications": spec_list
         }
 
@@ -2,6 +2,7 @@
 
 import subprocess
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -9,12 +10,18 @@ from ids_mcp_server.config import AuditToolConfig
 
 logger = logging.getLogger(__name__)
 
+# Project root (tools/ids-audit-tool/bin/ is resolved relative to this)
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
 
 def get_audit_tool_path(config: Optional[AuditToolConfig] = None) -> Optional[Path]:
     """
     Get the path to ids-tool.exe.
 
     Checks config for custom path first, then looks in tools/ids-audit-tool/ directory.
+    Only successful lookups are cached (per config), so a tool installed after a
+    failed lookup is found on the next call. Call ``_locate_audit_tool.cache_clear()``
+    after moving the tool in a running process.
 
     Args:
         config: Optional AuditToolConfig. If provided and has a custom path, uses that.
@@ -22,6 +29,28 @@ def get_audit_tool_path(config: Optional[AuditToolConfig] = None) -> Optional[Pa
     Returns:
         Path to ids-tool.exe if found, None otherwise
     """
+    try:
+        return _locate_audit_tool(config)
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _locate_audit_tool(config: Optional[AuditToolConfig]) -> Path:
+    """
+    Find ids-tool.exe for a config.
+
+    Raises instead of returning None so lru_cache never stores a miss.
+
+    Args:
+        config: Optional AuditToolConfig with a custom path
+
+    Returns:
+        Path to ids-tool.exe
+
+    Raises:
+        FileNotFoundError: If the tool is not found
+    """
     # Check config for custom path first
     if config and config.path:
         custom_path = Path(config.path)
@@ -36,8 +65,7 @@ def get_audit_tool_path(config: Optional[AuditToolConfig] = None) -> Optional[Pa
         logger.warning(f"IDS-Audit-tool not found at configured path: {config.path}")
 
     # Default: look in tools/ids-audit-tool/bin/ directory relative to project root
-    project_root = Path(__file__).parent.parent.parent.parent
-    tool_path = project_root / "tools" / "ids-audit-tool" / "bin" / "ids-tool.exe"
+    tool_path = _REPO_ROOT / "tools" / "ids-audit-tool" / "bin" / "ids-tool.exe"
 
     if tool_path.exists():
         return tool_path
@@ -47,7 +75,7 @@ def get_audit_tool_path(config: Optional[AuditToolConfig] = None) -> Optional[Pa
         f"Expected location: {tool_path}\n"
         f"Download binaries from: https://github.com/buildingSMART/IDS-Audit-tool/releases/download/audit-1.0.0/ids-audit-tool.zip"
     )
-    return None
+    raise FileNotFoundError(tool_path)
 
 
 def run_audit_tool(ids_file_path: str, config: Optional[AuditToolConfig] = None) -> Dict[str, Any]:
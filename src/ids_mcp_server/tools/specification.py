@@ -7,6 +7,14 @@ from ifctester import ids
 
 from ids_mcp_server.session.manager import get_or_create_session
 
+# IFC schema versions accepted by IDS 1.0
+_VALID_IFC_VERSIONS = frozenset({"IFC2X3", "IFC4", "IFC4X3_ADD2"})
+
+# Shorthand spellings normalized to a valid version
+_IFC_VERSION_ALIASES = {
+    "IFC4X3": "IFC4X3_ADD2",
+}
+
 
 def _find_specification(ids_obj: ids.Ids, spec_id: str) -> ids.Specification:
     """
@@ -65,18 +73,15 @@ async def add_specification(
         await ctx.info(f"Adding specification: {name}")
 
         # Validate IFC versions and normalize
-        valid_versions = {"IFC2X3", "IFC4", "IFC4X3_ADD2"}
-        version_mapping = {
-            "IFC4X3": "IFC4X3_ADD2",  # Normalize IFC4X3 to IFC4X3_ADD2
-        }
         normalized_versions = []
         for version in ifc_versions:
             version_upper = version.upper()
             # Apply mapping if exists
-            version_upper = version_mapping.get(version_upper, version_upper)
-            if version_upper not in valid_versions:
+            version_upper = _IFC_VERSION_ALIASES.get(version_upper, version_upper)
+            if version_upper not in _VALID_IFC_VERSIONS:
                 raise ToolError(
-                    f"Invalid IFC version: {version}. Valid versions: {', '.join(valid_versions)}"
+                    f"Invalid IFC version: {version}. "
+                    f"Valid versions: {', '.join(sorted(_VALID_IFC_VERSIONS))}"
                 )
             normalized_versions.append(version_upper)
 
@@ -7,6 +7,7 @@ from fastmcp import Context
 from fastmcp.exceptions import ToolError
 from ifctester import ids, reporter
 import ifcopenshell
+import orjson
 
 from ids_mcp_server.session.manager import get_or_create_session
 from ids_mcp_server.config import load_config_from_env
@@ -97,8 +98,8 @@ async def validate_ids(ctx: Context) -> Dict[str, Any]:
         xsd_valid = True
         try:
             xml_string = ids_obj.to_string()
-            # Try to parse it back with XSD validation
-            validated_ids = ids.from_string(xml_string, validate=True)
+            # Validate it against IfcTester's compiled XSD schema
+            ids.get_schema().validate(xml_string)
         except Exception as e:
             xsd_valid = False
             errors.append(f"XSD validation failed: {str(e)}")
@@ -220,17 +221,15 @@ async def validate_ifc_model(
             }
         }
     """
-    import json as json_lib
-
     try:
+        # Validate file exists (before any session work, so bad paths fail fast)
+        if not Path(ifc_file_path).exists():
+            raise ToolError(f"IFC file not found: {ifc_file_path}")
+
         ids_obj = await get_or_create_session(ctx)
 
         await ctx.info(f"Validating IFC model: {ifc_file_path}")
 
-        # Validate file exists
-        if not Path(ifc_file_path).exists():
-            raise ToolError(f"IFC file not found: {ifc_file_path}")
-
         # Check has specifications
         if not ids_obj.specifications:
             raise ToolError("IDS has no specifications to validate against")
@@ -255,7 +254,7 @@ async def validate_ifc_model(
 
             # Parse the JSON report to extract structured data
             try:
-                report_data = json_lib.loads(raw_report)
+                report_data = orjson.loads(raw_report)
 
                 # Extract specification-level summary
                 specifications_summary = []
@@ -353,7 +353,10 @@ async def test_validate_ifc_model_json_parsing_error(mock_context):
 
     try:
         # Patch JSON parsing to raise an exception
-        with patch('json.loads', side_effect=ValueError("JSON parse error")):
+        with patch(
+            'ids_mcp_server.tools.validation.orjson.loads',
+            side_effect=ValueError("JSON parse error")
+        ):
             result = await validate_ifc_model(
                 ifc_file_path=ifc_path,
                 report_format="json",
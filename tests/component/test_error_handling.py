@@ -217,8 +217,11 @@ async def test_validate_ids_xsd_validation_failure(mock_context):
     await create_ids(title="Test", ctx=mock_context)
     await add_specification(name="Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
 
-    # Patch from_string to raise XSD validation error
-    with patch('ids_mcp_server.tools.validation.ids.from_string', side_effect=Exception("XSD validation failed")):
+    # Patch the XSD check to raise a validation error
+    with patch(
+        'ids_mcp_server.tools.validation.ids.get_schema',
+        side_effect=Exception("XSD validation failed")
+    ):
         result = await validate_ids(ctx=mock_context)
 
         # Should still return result, but with xsd_valid=False and errors
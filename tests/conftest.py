@@ -3,8 +3,9 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from pathlib import Path
+from ifctester import ids
 
-from ids_mcp_server.config import IDSMCPConfig
+from ids_mcp_server.config import IDSMCPConfig, load_config_from_env
 from ids_mcp_server.session.storage import get_session_storage
 
 
@@ -27,9 +28,43 @@ def mock_context():
     return ctx
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def build_test_ids():
+    """
+    Return a builder for the standard test IDS.
+
+    Every call returns a new "Test IDS" holding one IFC4 specification "S1"
+    ("Test Spec", minOccurs=0, maxOccurs="unbounded"). The flags add an
+    IFCWALL applicability entity, a Pset_WallCommon.FireRating requirement
+    and a Name attribute requirement (in that order).
+    """
+    def _build(with_entity=False, with_property=False, with_attribute=False):
+        spec = ids.Specification(
+            name="Test Spec",
+            ifcVersion=["IFC4"],
+            identifier="S1",
+            minOccurs=0,
+            maxOccurs="unbounded",
+        )
+        if with_entity:
+            spec.applicability.append(ids.Entity(name="IFCWALL"))
+        if with_property:
+            spec.requirements.append(
+                ids.Property(baseName="FireRating", propertySet="Pset_WallCommon")
+            )
+        if with_attribute:
+            spec.requirements.append(ids.Attribute(name="Name"))
+
+        ids_obj = ids.Ids(title="Test IDS")
+        ids_obj.specifications.append(spec)
+        return ids_obj
+
+    return _build
+
+
+@pytest.fixture(scope="session")
 def sample_ids_xml():
-    """Provide sample IDS XML with valid specification."""
+    """Provide sample IDS XML with valid specification (read-only)."""
     return """<?xml version="1.0" encoding="UTF-8"?>
 <ids:ids xmlns:ids="http://standards.buildingsmart.org/IDS"
          xmlns:xs="http://www.w3.org/2001/XMLSchema"
@@ -61,9 +96,27 @@ def cleanup_sessions():
     storage.clear()
 
 
-@pytest.fixture
-def temp_ids_file(tmp_path, sample_ids_xml):
-    """Create temporary IDS file for testing."""
-    ids_file = tmp_path / "test.ids"
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Re-read environment config in each test (picks up monkeypatch.setenv)."""
+    load_config_from_env.cache_clear()
+    yield
+    load_config_from_env.cache_clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_ids_schema():
+    """Compile the IDS XSD once before the first validating test.
+
+    IfcTester keeps the compiled schema in a module global, so this covers
+    export_ids, validate_ids and ids.from_string(..., validate=True) alike.
+    """
+    ids.get_schema()
+
+
+@pytest.fixture(scope="session")
+def temp_ids_file(tmp_path_factory, sample_ids_xml):
+    """Create temporary IDS file once per session (tests must not modify it)."""
+    ids_file = tmp_path_factory.mktemp("ids") / "test.ids"
     ids_file.write_text(sample_ids_xml)
     return ids_file
@@ -15,7 +15,7 @@ from ids_mcp_server.tools.validation import validate_ids
 
 
 @pytest.mark.asyncio
-async def test_complete_ids_creation_workflow(mock_context):
+async def test_complete_ids_creation_workflow(mock_context, snapshot):
     """Test creating a complete IDS document from start to finish."""
     # Step 1: Create IDS document
     await create_ids(
@@ -108,13 +108,8 @@ async def test_complete_ids_creation_workflow(mock_context):
     assert export_result["status"] == "exported"
     assert export_result["validation"]["valid"] is True
 
-    # Step 10: Verify XML contains all elements
-    xml = export_result["xml"]
-    assert "Building Requirements" in xml
-    assert "External Wall Requirements" in xml
-    assert "Fire Door Requirements" in xml
-    assert "IFCWALL" in xml
-    assert "IFCDOOR" in xml
+    # Step 10: Verify XML matches the recorded export
+    assert export_result["xml"] == snapshot
 
 
 @pytest.mark.asyncio
@@ -191,6 +186,27 @@ async def test_round_trip_workflow(mock_context, tmp_path):
     assert info["specifications"][0]["name"] == "Test Specification"
 
 
+@pytest.mark.asyncio
+async def test_export_creates_parent_directory_workflow(mock_context, tmp_path):
+    """Test that exporting to a nested path creates the missing directories on disk."""
+    await create_ids(title="Nested Export", ctx=mock_context)
+    await add_specification(
+        name="Wall Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1"
+    )
+    await add_entity_facet(
+        spec_id="S1", location="applicability", entity_name="IFCWALL", ctx=mock_context
+    )
+
+    # Create nested path that doesn't exist
+    output_file = tmp_path / "nested" / "dir" / "test.ids"
+
+    result = await export_ids(ctx=mock_context, output_path=str(output_file))
+
+    assert result["status"] == "exported"
+    assert output_file.exists()
+    assert output_file.parent.exists()
+
+
 @pytest.mark.asyncio
 async def test_complex_specification_workflow(mock_context):
     """Test creating complex specification with multiple facet types."""
@@ -254,7 +270,7 @@ async def test_complex_specification_workflow(mock_context):
 
 
 @pytest.mark.asyncio
-async def test_multi_version_specification_workflow(mock_context):
+async def test_multi_version_specification_workflow(mock_context, snapshot):
     """Test creating specification that supports multiple IFC versions."""
     await create_ids(title="Multi-Version IDS", ctx=mock_context)
 
@@ -286,9 +302,7 @@ async def test_multi_version_specification_workflow(mock_context):
     assert export_result["validation"]["valid"] is True
 
     # Verify in XML
-    xml = export_result["xml"]
-    assert "IFC2X3" in xml or "ifc2x3" in xml.lower()
-    assert "IFC4" in xml or "ifc4" in xml.lower()
+    assert export_result["xml"] == snapshot
 
 
 @pytest.mark.asyncio
@@ -344,7 +358,7 @@ async def test_empty_to_complete_workflow(mock_context):
 
 
 @pytest.mark.asyncio
-async def test_export_and_reload_preserves_structure(mock_context):
+async def test_export_and_reload_preserves_structure(mock_context, snapshot):
     """Test that exporting and reloading preserves all structure."""
     # Create complex IDS
     await create_ids(
@@ -410,8 +424,6 @@ async def test_export_and_reload_preserves_structure(mock_context):
     assert export1["validation"]["valid"] is True
     assert export2["validation"]["valid"] is True
 
-    # Both should have same structure (titles should match)
-    assert "Structure Test" in xml1
-    assert "Structure Test" in xml2
-    assert "Detailed Spec" in xml1
-    assert "Detailed Spec" in xml2
+    # Both should have same structure
+    assert xml1 == snapshot
+    assert xml2 == snapshot(name="reloaded")
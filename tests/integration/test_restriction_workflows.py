@@ -1,6 +1,9 @@
 """Integration tests for restriction workflows."""
 
+import re
+
 import pytest
+from ifctester import ids
 from ids_mcp_server.tools.document import create_ids, export_ids
 from ids_mcp_server.tools.specification import add_specification
 from ids_mcp_server.tools.facets import add_entity_facet, add_property_facet, add_attribute_facet
@@ -11,7 +14,20 @@ from ids_mcp_server.tools.restrictions import (
     add_length_restriction
 )
 from ids_mcp_server.session.storage import get_session_storage
-from ifctester import ids
+
+
+# Fragments the fire safety export must contain, matched in a single scan
+_FIRE_FRAGMENTS = frozenset({
+    'value="REI30"',
+    'value="REI60"',
+    'value="REI90"',
+    'value="EW-[0-9]{3}"',
+    '<xs:enumeration',
+    '<xs:pattern',
+    '<title>Fire Safety Wall Requirements</title>',
+    'name="Fire-rated External Walls"',
+})
+_FIRE_PAT = re.compile("|".join(re.escape(fragment) for fragment in _FIRE_FRAGMENTS))
 
 
 @pytest.mark.asyncio
@@ -174,23 +190,15 @@ async def test_fire_safety_specification_workflow(mock_context):
     # Export to XML
     result = await export_ids(ctx=mock_context, validate=False)
 
-    # Verify XML contains all restrictions
+    # Verify XML contains all restrictions and the IDS structure
     xml = result["xml"]
-    assert "<xs:enumeration" in xml
-    assert 'value="REI30"' in xml
-    assert 'value="REI60"' in xml
-    assert 'value="REI90"' in xml
-    assert "<xs:pattern" in xml
-    assert 'value="EW-[0-9]{3}"' in xml
+    found = set(_FIRE_PAT.findall(xml))
+    assert _FIRE_FRAGMENTS <= found, sorted(_FIRE_FRAGMENTS - found)
     assert "<xs:minInclusive" in xml or 'value="2.4"' in xml
     assert "<xs:maxInclusive" in xml or 'value="3.5"' in xml
     assert "<xs:minLength" in xml or 'value="10"' in xml
     assert "<xs:maxLength" in xml or 'value="200"' in xml
 
-    # Verify IDS structure
-    assert '<title>Fire Safety Wall Requirements</title>' in xml
-    assert 'name="Fire-rated External Walls"' in xml
-
 
 @pytest.mark.asyncio
 async def test_multiple_specifications_with_restrictions(mock_context):
@@ -0,0 +1,36 @@
+"""Benchmarks for seeding a test session from a template IDS.
+
+Compares the two ways a fixture can hand each test a private copy of a
+prebuilt IDS. Deselected by default; run with:
+
+    pytest tests/perf -m perf -n 0 --no-cov
+"""
+
+import copy
+
+import pytest
+from ifctester import ids
+
+pytestmark = pytest.mark.perf
+
+
+@pytest.fixture(scope="module")
+def template_ids(build_test_ids):
+    """Build the canonical test IDS (one spec, IFCWALL applicability)."""
+    return build_test_ids(with_entity=True)
+
+
+def test_bench_seed_deepcopy(benchmark, template_ids):
+    """Benchmark copying the template object graph with deepcopy."""
+    result = benchmark(copy.deepcopy, template_ids)
+
+    assert len(result.specifications) == 1
+
+
+def test_bench_seed_from_string(benchmark, template_ids):
+    """Benchmark rebuilding the template from its serialized XML."""
+    template_xml = template_ids.to_string()
+
+    result = benchmark(ids.from_string, template_xml, validate=False)
+
+    assert len(result.specifications) == 1
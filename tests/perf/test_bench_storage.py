@@ -0,0 +1,65 @@
+"""Throughput benchmarks for session storage.
+
+Deselected by default; run with:
+
+    pytest tests/perf -m perf -n 0 --no-cov
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor, wait
+from ids_mcp_server.session.storage import SessionStorage
+from ids_mcp_server.session.models import SessionData
+
+pytestmark = pytest.mark.perf
+
+THREADS = 8
+OPS_PER_THREAD = 250
+
+
+@pytest.fixture
+def storage():
+    """Provide a private storage instance so benchmarks don't touch the global one."""
+    return SessionStorage()
+
+
+def test_bench_set(benchmark, storage):
+    """Benchmark a single uncontended set."""
+    data = SessionData(session_id="sid")
+
+    benchmark(storage.set, "sid", data)
+
+    assert storage.get("sid") is data
+
+
+def test_bench_get(benchmark, storage):
+    """Benchmark a single uncontended get."""
+    data = SessionData(session_id="sid")
+    storage.set("sid", data)
+
+    result = benchmark(storage.get, "sid")
+
+    assert result is data
+
+
+def test_bench_set_get_contended(benchmark, storage):
+    """Benchmark set/get round-trips from several threads at once."""
+    batches = [
+        [
+            (f"session-{t}-{i}", SessionData(session_id=f"session-{t}-{i}"))
+            for i in range(OPS_PER_THREAD)
+        ]
+        for t in range(THREADS)
+    ]
+
+    def worker(batch):
+        for session_id, data in batch:
+            storage.set(session_id, data)
+            storage.get(session_id)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        def run():
+            wait([executor.submit(worker, batch) for batch in batches])
+
+        benchmark.pedantic(run, iterations=10, rounds=5, warmup_rounds=1)
+
+    assert storage.session_count() == THREADS * OPS_PER_THREAD
@@ -2,6 +2,7 @@
 
 import pytest
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from ids_mcp_server.session.storage import SessionStorage
 from ids_mcp_server.session.models import SessionData
 
@@ -35,6 +36,7 @@ def test_storage_delete():
 
     storage.delete("test-456")
     assert storage.get("test-456") is None
+    assert not storage.contains("test-456")
 
 
 def test_storage_get_all_session_ids():
@@ -45,16 +47,61 @@ def test_storage_get_all_session_ids():
     storage.set("session-2", SessionData("session-2"))
     storage.set("session-3", SessionData("session-3"))
 
-    session_ids = storage.get_all_session_ids()
-    assert len(session_ids) == 3
-    assert "session-1" in session_ids
-    assert "session-2" in session_ids
-    assert "session-3" in session_ids
+    assert storage.session_count() == 3
+    assert storage.contains("session-1")
+    assert storage.contains("session-2")
+    assert storage.contains("session-3")
+    assert sorted(storage.get_all_session_ids()) == ["session-1", "session-2", "session-3"]
 
 
 def test_storage_thread_safety():
     """Test concurrent access to storage."""
     storage = SessionStorage()
+
+    def create_session(sid):
+        storage.set(sid, SessionData(session_id=sid))
+
+    # Create 100 sessions concurrently on a pooled set of worker threads;
+    # consuming the map re-raises any exception from a worker
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        list(executor.map(create_session, [f"session-{i}" for i in range(100)]))
+
+    assert storage.session_count() == 100
+
+    # SessionData uses __slots__, so stored sessions carry no instance __dict__
+    assert not hasattr(storage.get("session-0"), "__dict__")
+
+
+def test_storage_set_many():
+    """Test bulk-storing sessions."""
+    storage = SessionStorage()
+
+    storage.set_many((f"session-{i}", SessionData(f"session-{i}")) for i in range(10))
+
+    assert storage.session_count() == 10
+    assert storage.get("session-7").metadata.session_id == "session-7"
+
+
+def test_storage_thread_safety_set_many():
+    """Test concurrent bulk inserts in chunks of 25."""
+    storage = SessionStorage()
+    session_ids = [f"session-{i}" for i in range(100)]
+    chunks = [session_ids[i:i + 25] for i in range(0, len(session_ids), 25)]
+
+    def create_sessions(chunk):
+        storage.set_many((sid, SessionData(session_id=sid)) for sid in chunk)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(create_sessions, chunks))
+
+    assert storage.session_count() == 100
+    assert all(storage.contains(sid) for sid in session_ids)
+
+
+@pytest.mark.slow
+def test_storage_thread_safety_raw_threads():
+    """Test concurrent access to storage with one thread per session."""
+    storage = SessionStorage()
     errors = []
 
     def create_session(sid):
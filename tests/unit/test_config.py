@@ -32,3 +32,18 @@ def test_config_from_env(monkeypatch):
     assert config.server.mask_error_details is True
     assert config.session.session_timeout == 7200
     assert config.session.cleanup_interval == 1800
+
+
+def test_config_from_env_is_cached(monkeypatch):
+    """Test that env config is read once until the cache is cleared."""
+    from ids_mcp_server.config import load_config_from_env
+
+    monkeypatch.setenv("IDS_LOG_LEVEL", "WARNING")
+    config = load_config_from_env()
+
+    monkeypatch.setenv("IDS_LOG_LEVEL", "ERROR")
+    assert load_config_from_env() is config
+    assert config.server.log_level == "WARNING"
+
+    load_config_from_env.cache_clear()
+    assert load_config_from_env().server.log_level == "ERROR"
@@ -1,7 +1,15 @@
 """Tests for __main__ entry point."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, DEFAULT
+
+from ids_mcp_server.config import ServerConfig, SessionConfig, IDSMCPConfig
+
+# Shared configuration returned by the mocked load_config_from_env
+_MOCK_CFG = IDSMCPConfig(
+    server=ServerConfig(log_level="INFO", mask_error_details=False),
+    session=SessionConfig(session_timeout=86400, cleanup_interval=3600)
+)
 
 
 def test_setup_logging():
@@ -14,74 +22,62 @@ def test_setup_logging():
     # Can't reliably check level due to pytest's own logging setup
 
 
-@patch('ids_mcp_server.__main__.mcp')
-@patch('ids_mcp_server.__main__.load_config_from_env')
-def test_main_successful_run(mock_config, mock_mcp):
+def test_main_successful_run():
     """Test main function with successful server run."""
     from ids_mcp_server.__main__ import main
-    from ids_mcp_server.config import ServerConfig, SessionConfig, IDSMCPConfig
 
-    # Mock configuration
-    mock_config.return_value = IDSMCPConfig(
-        server=ServerConfig(log_level="INFO", mask_error_details=False),
-        session=SessionConfig(session_timeout=86400, cleanup_interval=3600)
-    )
+    with patch.multiple(
+        "ids_mcp_server.__main__", mcp=DEFAULT, load_config_from_env=DEFAULT
+    ) as mocks:
+        mocks["load_config_from_env"].return_value = _MOCK_CFG
 
-    # Mock mcp.run() to not block
-    mock_mcp.run = MagicMock()
+        # Mock mcp.run() to not block
+        mocks["mcp"].run = MagicMock()
 
-    # Run main
-    main()
+        # Run main
+        main()
 
-    # Verify config was loaded
-    mock_config.assert_called_once()
+        # Verify config was loaded
+        mocks["load_config_from_env"].assert_called_once()
 
-    # Verify server was started
-    mock_mcp.run.assert_called_once()
+        # Verify server was started
+        mocks["mcp"].run.assert_called_once()
 
 
-@patch('ids_mcp_server.__main__.mcp')
-@patch('ids_mcp_server.__main__.load_config_from_env')
-def test_main_keyboard_interrupt(mock_config, mock_mcp):
+def test_main_keyboard_interrupt():
     """Test main function handles KeyboardInterrupt."""
     from ids_mcp_server.__main__ import main
-    from ids_mcp_server.config import ServerConfig, SessionConfig, IDSMCPConfig
 
-    # Mock configuration
-    mock_config.return_value = IDSMCPConfig(
-        server=ServerConfig(log_level="INFO", mask_error_details=False),
-        session=SessionConfig(session_timeout=86400, cleanup_interval=3600)
-    )
+    with patch.multiple(
+        "ids_mcp_server.__main__", mcp=DEFAULT, load_config_from_env=DEFAULT
+    ) as mocks:
+        mocks["load_config_from_env"].return_value = _MOCK_CFG
 
-    # Mock mcp.run() to raise KeyboardInterrupt
-    mock_mcp.run = MagicMock(side_effect=KeyboardInterrupt())
+        # Mock mcp.run() to raise KeyboardInterrupt
+        mocks["mcp"].run = MagicMock(side_effect=KeyboardInterrupt())
 
-    # Run main - should not raise
-    main()
+        # Run main - should not raise
+        main()
 
-    # Verify server was called
-    mock_mcp.run.assert_called_once()
+        # Verify server was called
+        mocks["mcp"].run.assert_called_once()
 
 
-@patch('ids_mcp_server.__main__.mcp')
-@patch('ids_mcp_server.__main__.load_config_from_env')
-def test_main_with_exception(mock_config, mock_mcp):
+def test_main_with_exception():
     """Test main function handles exceptions."""
     from ids_mcp_server.__main__ import main
-    from ids_mcp_server.config import ServerConfig, SessionConfig, IDSMCPConfig
 
-    # Mock configuration
-    mock_config.return_value = IDSMCPConfig(
-        server=ServerConfig(log_level="INFO", mask_error_details=False),
-        session=SessionConfig(session_timeout=86400, cleanup_interval=3600)
-    )
+    with patch.multiple(
+        "ids_mcp_server.__main__", mcp=DEFAULT, load_config_from_env=DEFAULT
+    ) as mocks:
+        mocks["load_config_from_env"].return_value = _MOCK_CFG
 
-    # Mock mcp.run() to raise exception
-    mock_mcp.run = MagicMock(side_effect=RuntimeError("Test error"))
+        # Mock mcp.run() to raise exception
+        mocks["mcp"].run = MagicMock(side_effect=RuntimeError("Test error"))
 
-    # Run main - should raise
-    with pytest.raises(RuntimeError, match="Test error"):
-        main()
+        # Run main - should raise
+        with pytest.raises(RuntimeError, match="Test error"):
+            main()
 
-    # Verify server was called
-    mock_mcp.run.assert_called_once()
+        # Verify server was called
+        mocks["mcp"].run.assert_called_once()
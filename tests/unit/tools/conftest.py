@@ -0,0 +1,113 @@
+"""Shared fixtures for tool unit tests."""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock
+from ifctester import ids
+
+from ids_mcp_server.session.models import SessionData
+from ids_mcp_server.session.storage import get_session_storage
+from ids_mcp_server.tools import document, facets, specification
+
+
+@pytest.fixture(scope="session")
+def tools():
+    """Expose the document, specification and facet tools under one namespace."""
+    return SimpleNamespace(
+        create_ids=document.create_ids,
+        add_specification=specification.add_specification,
+        add_entity_facet=facets.add_entity_facet,
+        add_property_facet=facets.add_property_facet,
+        add_attribute_facet=facets.add_attribute_facet,
+        add_classification_facet=facets.add_classification_facet,
+        add_material_facet=facets.add_material_facet,
+        add_partof_facet=facets.add_partof_facet,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_context():
+    """Provide one FastMCP Context mock per module (session id set per test)."""
+    from fastmcp import Context
+
+    ctx = MagicMock(spec=Context)
+    ctx.info = AsyncMock()
+    ctx.debug = AsyncMock()
+    ctx.warning = AsyncMock()
+    ctx.error = AsyncMock()
+    ctx.report_progress = AsyncMock()
+    return ctx
+
+
+@pytest.fixture
+def fresh_tool_session(mock_context):
+    """
+    Reset the shared context mock and start the test with an empty IDS session.
+
+    Tool modules request it through pytestmark; helper tests that never touch
+    a session (validators, audit tool) skip the per-test session setup.
+    """
+    mock_context.reset_mock()
+    # Unique per test, so no two tests share a storage entry on any xdist worker
+    mock_context.session_id = f"test-{uuid.uuid4().hex}"
+    session_data = SessionData(session_id=mock_context.session_id)
+    session_data.ids_obj = ids.Ids(title="Untitled IDS")
+    get_session_storage().set(mock_context.session_id, session_data)
+
+
+@pytest_asyncio.fixture
+async def no_leaked_tasks():
+    """
+    Fail a test that leaves tasks running on the shared session event loop.
+
+    Only the async tool modules request it, so sync tests never pull in the loop.
+    """
+    yield
+    current = asyncio.current_task()
+    leaked = [task for task in asyncio.all_tasks() if task is not current and not task.done()]
+    assert not leaked, f"Tasks leaked onto the shared event loop: {leaked}"
+
+
+@pytest.fixture(scope="session")
+def install_ids():
+    """Return a helper that stores an IDS object as a session and returns its SessionData."""
+
+    def _install(session_id, ids_obj):
+        session_data = SessionData(session_id=session_id)
+        session_data.ids_obj = ids_obj
+        session_data.set_ids_title(ids_obj.info["title"])
+        get_session_storage().set(session_id, session_data)
+        return session_data
+
+    return _install
+
+
+@pytest.fixture
+def prime_session(mock_context, build_test_ids, install_ids):
+    """
+    Return a helper that seeds the test's session with a freshly built IDS.
+
+    The helper takes build_test_ids' facet flags (spec "S1" plus optional
+    facets) and returns the test's context.
+    """
+
+    def _prime(**facets):
+        install_ids(mock_context.session_id, build_test_ids(**facets))
+        return mock_context
+
+    return _prime
+
+
+@pytest.fixture
+def get_first_requirement(mock_context):
+    """Return a getter for requirement facets of the session's first specification."""
+    storage = get_session_storage()
+
+    def _get(idx=0):
+        return storage.get(mock_context.session_id).ids_obj.specifications[0].requirements[idx]
+
+    return _get
@@ -1,5 +1,8 @@
 """RED: Tests for document management tools."""
 
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+
 import pytest
 from ifctester import ids
 from fastmcp.exceptions import ToolError
@@ -10,6 +13,10 @@ from ids_mcp_server.tools.document import (
     get_ids_info
 )
 
+pytestmark = pytest.mark.usefixtures("fresh_tool_session", "no_leaked_tasks")
+
+IDS_NS = "{http://standards.buildingsmart.org/IDS}"
+
 
 @pytest.mark.asyncio
 async def test_create_ids_minimal(mock_context):
@@ -66,45 +73,23 @@ async def test_create_ids_stores_in_session(mock_context):
 
 
 @pytest.mark.asyncio
-async def test_export_ids_to_string(mock_context):
+async def test_export_ids_to_string(mock_context, prime_session):
     """Test exporting IDS to XML string."""
-    from ifctester import ids as ids_lib
-    from ids_mcp_server.session.storage import get_session_storage
-
-    # Create IDS
-    await create_ids(title="Export Test", ctx=mock_context)
-
-    # Add a specification (required by IDS XSD schema)
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = ids_lib.Specification(name="Test Spec", ifcVersion=["IFC4"])
-    spec.applicability.append(ids_lib.Entity(name="IFCWALL"))
-    session_data.ids_obj.specifications.append(spec)
-
-    # Export to string
+    prime_session(with_entity=True)
     result = await export_ids(ctx=mock_context)
 
     assert result["status"] == "exported"
     assert "xml" in result
-    assert '<ids xmlns="http://standards.buildingsmart.org/IDS"' in result["xml"]
-    assert "<title>Export Test</title>" in result["xml"]
+
+    root = ET.fromstring(result["xml"])
+    assert root.tag == f"{IDS_NS}ids"
+    assert root.find(f".//{IDS_NS}title").text == "Test IDS"
 
 
 @pytest.mark.asyncio
-async def test_export_ids_validates_with_xsd(mock_context):
+async def test_export_ids_validates_with_xsd(mock_context, prime_session):
     """Test that exported XML validates against XSD."""
-    from ifctester import ids as ids_lib
-    from ids_mcp_server.session.storage import get_session_storage
-
-    await create_ids(title="Validation Test", ctx=mock_context)
-
-    # Add a specification (required by IDS XSD schema)
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = ids_lib.Specification(name="Test Spec", ifcVersion=["IFC4"])
-    spec.applicability.append(ids_lib.Entity(name="IFCWALL"))
-    session_data.ids_obj.specifications.append(spec)
-
+    prime_session(with_entity=True)
     result = await export_ids(ctx=mock_context, validate=True)
 
     # Critical: Use IfcTester to validate
@@ -117,22 +102,11 @@ async def test_export_ids_validates_with_xsd(mock_context):
 
 
 @pytest.mark.asyncio
-async def test_export_ids_to_file(mock_context, tmp_path):
+async def test_export_ids_to_file(mock_context, prime_session, tmp_path):
     """Test exporting IDS to file."""
-    from ifctester import ids as ids_lib
-    from ids_mcp_server.session.storage import get_session_storage
-
+    prime_session(with_entity=True)
     output_file = tmp_path / "test.ids"
 
-    await create_ids(title="File Export", ctx=mock_context)
-
-    # Add a specification (required by IDS XSD schema)
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = ids_lib.Specification(name="Test Spec", ifcVersion=["IFC4"])
-    spec.applicability.append(ids_lib.Entity(name="IFCWALL"))
-    session_data.ids_obj.specifications.append(spec)
-
     result = await export_ids(
         ctx=mock_context,
         output_path=str(output_file)
@@ -144,7 +118,7 @@ async def test_export_ids_to_file(mock_context, tmp_path):
 
     # Verify file is valid IDS
     loaded_ids = ids.open(str(output_file), validate=True)
-    assert loaded_ids.info["title"] == "File Export"
+    assert loaded_ids.info["title"] == "Test IDS"
 
 
 @pytest.mark.asyncio
@@ -195,15 +169,19 @@ async def test_get_ids_info_empty(mock_context):
 
 @pytest.mark.asyncio
 async def test_load_ids_invalid_source_type(mock_context):
-    """Test that invalid source_type raises error."""
-    with pytest.raises(ToolError) as exc_info:
-        await load_ids(
-            source="dummy",
-            ctx=mock_context,
-            source_type="invalid"
-        )
+    """Test that invalid source_type raises error before any loading."""
+    with patch("ids_mcp_server.tools.document.create_session_from_file") as from_file, \
+            patch("ids_mcp_server.tools.document.create_session_from_string") as from_string:
+        with pytest.raises(ToolError) as exc_info:
+            await load_ids(
+                source="dummy",
+                ctx=mock_context,
+                source_type="invalid"
+            )
 
     assert "Invalid source_type" in str(exc_info.value)
+    from_file.assert_not_called()
+    from_string.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -233,28 +211,21 @@ async def test_load_ids_invalid_xml_string(mock_context):
 
 
 @pytest.mark.asyncio
-async def test_export_ids_creates_parent_directory(mock_context, tmp_path):
-    """Test that export creates parent directory if needed."""
-    from ifctester import ids as ids_lib
+async def test_export_ids_calls_mkdir_with_parents(mock_context, prime_session, tmp_path):
+    """Test that export asks for the parent directory to be created (no disk I/O)."""
     from ids_mcp_server.session.storage import get_session_storage
 
-    # Create nested path that doesn't exist
-    output_file = tmp_path / "nested" / "dir" / "test.ids"
-
-    await create_ids(title="Test IDS", ctx=mock_context)
+    prime_session(with_entity=True)
 
-    # Add specification
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = ids_lib.Specification(name="Test Spec", ifcVersion=["IFC4"])
-    spec.applicability.append(ids_lib.Entity(name="IFCWALL"))
-    session_data.ids_obj.specifications.append(spec)
+    output_file = tmp_path / "nested" / "dir" / "test.ids"
+    ids_obj = get_session_storage().get(mock_context.session_id).ids_obj
 
-    result = await export_ids(ctx=mock_context, output_path=str(output_file))
+    with patch("pathlib.Path.mkdir") as mock_mkdir, patch.object(ids_obj, "to_xml") as mock_to_xml:
+        result = await export_ids(ctx=mock_context, output_path=str(output_file), validate=False)
 
     assert result["status"] == "exported"
-    assert output_file.exists()
-    assert output_file.parent.exists()
+    mock_mkdir.assert_called_with(parents=True, exist_ok=True)
+    mock_to_xml.assert_called_once_with(str(output_file))
 
 
 @pytest.mark.asyncio
@@ -271,28 +242,16 @@ async def test_create_ids_error_handling(mock_context):
 
 
 @pytest.mark.asyncio
-async def test_get_ids_info_with_specifications(mock_context):
+async def test_get_ids_info_with_specifications(mock_context, prime_session):
     """Test get_ids_info with specifications that have facets."""
-    from ifctester import ids as ids_lib
     from ids_mcp_server.session.storage import get_session_storage
 
-    await create_ids(title="Test IDS", ctx=mock_context)
-
-    # Manually add specification with facets for testing
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-
-    spec = ids_lib.Specification(
-        name="Complete Spec",
-        ifcVersion=["IFC4"],
-        identifier="S1",
-        description="Test description"
-    )
-    spec.applicability.append(ids_lib.Entity(name="IFCWALL"))
-    spec.requirements.append(ids_lib.Property(baseName="FireRating", cardinality="required"))
-    spec.requirements.append(ids_lib.Material(value="Concrete"))
+    prime_session(with_entity=True)
 
-    session_data.ids_obj.specifications.append(spec)
+    # Manually add requirement facets to the primed specification
+    spec = get_session_storage().get(mock_context.session_id).ids_obj.specifications[0]
+    spec.requirements.append(ids.Property(baseName="FireRating", cardinality="required"))
+    spec.requirements.append(ids.Material(value="Concrete"))
 
     result = await get_ids_info(ctx=mock_context)
 
@@ -300,7 +259,7 @@ async def test_get_ids_info_with_specifications(mock_context):
     assert len(result["specifications"]) == 1
 
     spec_info = result["specifications"][0]
-    assert spec_info["name"] == "Complete Spec"
+    assert spec_info["name"] == "Test Spec"
     assert spec_info["identifier"] == "S1"
     assert spec_info["ifc_versions"] == ["IFC4"]
     assert spec_info["applicability_facets"] == 1
@@ -321,20 +280,16 @@ async def test_load_ids_updates_session_metadata(mock_context, sample_ids_xml):
     assert len(result["specifications"]) == 1
 
 
-@pytest.mark.asyncio  
-async def test_export_ids_validation_errors(mock_context):
+@pytest.mark.asyncio
+async def test_export_ids_validation_errors(mock_context, prime_session):
     """Test export with validation returning errors."""
-    from ifctester import ids as ids_lib
     from ids_mcp_server.session.storage import get_session_storage
 
-    await create_ids(title="Test IDS", ctx=mock_context)
+    prime_session(with_entity=True)
 
-    # Add invalid specification (no applicability) - may cause validation issues
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = ids_lib.Specification(name="Test Spec", ifcVersion=["IFC4"])
-    # Don't add applicability - this might cause validation issues
-    session_data.ids_obj.specifications.append(spec)
+    # Remove applicability from the primed spec - may cause validation issues
+    spec = get_session_storage().get(mock_context.session_id).ids_obj.specifications[0]
+    spec.applicability.clear()
 
     # Try to export - should handle validation
     try:
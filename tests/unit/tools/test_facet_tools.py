@@ -2,140 +2,128 @@
 
 import pytest
 from ifctester import ids
-from ids_mcp_server.tools.facets import (
-    add_entity_facet,
-    add_property_facet,
-    add_attribute_facet,
-    add_classification_facet,
-    add_material_facet,
-    add_partof_facet
-)
-from ids_mcp_server.tools.specification import add_specification
-from ids_mcp_server.tools.document import create_ids
 from ids_mcp_server.session.storage import get_session_storage
 from fastmcp.exceptions import ToolError
 
+pytestmark = pytest.mark.usefixtures("fresh_tool_session", "no_leaked_tasks")
 
-# Entity Facet Tests
-@pytest.mark.asyncio
-async def test_add_entity_facet_to_applicability(mock_context):
-    """Test adding entity facet to applicability."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
+# No per-test asyncio marks: asyncio_mode = auto collects every coroutine test
+# here and runs it on the session-wide event loop (see pytest.ini).
 
-    result = await add_entity_facet(
-        spec_id="S1",
-        location="applicability",
-        entity_name="IFCWALL",
-        ctx=mock_context
+# Fragments every "second applicability entity" error message must contain
+_ENTITY_ERR_MARKERS = (
+    "IDS 1.0 XSD constraint violation",
+    "Only ONE entity facet",
+    "WORKAROUND",
+    "separate specification",
+)
+
+
+# Happy-path Facet Tests
+@pytest.mark.parametrize(
+    "facet_name,location,kwargs,facet_type,facet_cls,expected",
+    [
+        (
+            "add_entity_facet", "applicability",
+            {"entity_name": "IFCWALL"},
+            "entity", ids.Entity, {"name": "IFCWALL"}
+        ),
+        (
+            "add_property_facet", "requirements",
+            {"property_name": "FireRating", "property_set": "Pset_WallCommon"},
+            "property", ids.Property, {"baseName": "FireRating", "propertySet": "Pset_WallCommon"}
+        ),
+        (
+            "add_attribute_facet", "requirements",
+            {"attribute_name": "Name", "value": "External Wall"},
+            "attribute", ids.Attribute, {"name": "Name", "value": "External Wall"}
+        ),
+        (
+            "add_classification_facet", "requirements",
+            {"classification_value": "Ss_25_10_20", "classification_system": "Uniclass"},
+            "classification", ids.Classification, {"value": "Ss_25_10_20", "system": "Uniclass"}
+        ),
+        (
+            "add_material_facet", "requirements",
+            {"material_value": "Concrete"},
+            "material", ids.Material, {"value": "Concrete"}
+        ),
+        (
+            "add_partof_facet", "applicability",
+            {"relation": "IFCRELCONTAINEDINSPATIALSTRUCTURE", "parent_entity": "IFCSPACE"},
+            "partof", ids.PartOf, {"relation": "IFCRELCONTAINEDINSPATIALSTRUCTURE"}
+        ),
+    ],
+    ids=["entity", "property", "attribute", "classification", "material", "partof"]
+)
+async def test_add_facet(
+    tools, prime_session, facet_name, location, kwargs, facet_type, facet_cls, expected
+):
+    """Test that each facet tool adds one facet of the right type and values."""
+    ctx = prime_session()
+    result = await getattr(tools, facet_name)(
+        spec_id="S1", location=location, ctx=ctx, **kwargs
     )
 
     assert result["status"] == "added"
-    assert result["facet_type"] == "entity"
+    assert result["facet_type"] == facet_type
 
     # Verify facet added
     storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    assert len(spec.applicability) == 1
-    assert isinstance(spec.applicability[0], ids.Entity)
-    assert spec.applicability[0].name == "IFCWALL"
+    spec = storage.get(ctx.session_id).ids_obj.specifications[0]
+    facets = getattr(spec, location)
+    assert len(facets) == 1
+    assert isinstance(facets[0], facet_cls)
+    for attr, value in expected.items():
+        assert getattr(facets[0], attr) == value
 
 
-@pytest.mark.asyncio
-async def test_add_entity_facet_with_predefined_type(mock_context):
+# Entity Facet Tests
+async def test_add_entity_facet_with_predefined_type(tools, prime_session):
     """Test adding entity facet with predefined type."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_entity_facet(
+    ctx = prime_session()
+    result = await tools.add_entity_facet(
         spec_id="S1",
         location="applicability",
         entity_name="IFCWALL",
-        ctx=mock_context,
+        ctx=ctx,
         predefined_type="SOLIDWALL"
     )
 
     assert result["status"] == "added"
 
     storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
+    spec = storage.get(ctx.session_id).ids_obj.specifications[0]
     entity = spec.applicability[0]
     assert entity.predefinedType == "SOLIDWALL"
 
 
-@pytest.mark.asyncio
-async def test_add_entity_facet_to_requirements(mock_context):
+async def test_add_entity_facet_to_requirements(tools, prime_session):
     """Test adding entity facet to requirements."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_entity_facet(
+    ctx = prime_session()
+    result = await tools.add_entity_facet(
         spec_id="S1",
         location="requirements",
         entity_name="IFCDOOR",
-        ctx=mock_context
+        ctx=ctx
     )
 
     assert result["status"] == "added"
 
     storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
+    spec = storage.get(ctx.session_id).ids_obj.specifications[0]
     assert len(spec.requirements) == 1
 
 
-@pytest.mark.asyncio
-async def test_add_entity_facet_invalid_location(mock_context):
-    """Test that invalid location raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    with pytest.raises(ToolError) as exc_info:
-        await add_entity_facet(
-            spec_id="S1",
-            location="invalid",
-            entity_name="IFCWALL",
-            ctx=mock_context
-        )
-
-    assert "Invalid location" in str(exc_info.value)
-
-
 # Property Facet Tests
-@pytest.mark.asyncio
-async def test_add_property_facet_minimal(mock_context):
-    """Test adding property facet with minimal fields."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name="FireRating",
-        ctx=mock_context,
-        property_set="Pset_WallCommon"
-    )
-
-    assert result["status"] == "added"
-    assert result["facet_type"] == "property"
-
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    assert len(spec.requirements) == 1
-    assert isinstance(spec.requirements[0], ids.Property)
-    assert spec.requirements[0].baseName == "FireRating"
-
-
-@pytest.mark.asyncio
-async def test_add_property_facet_complete(mock_context):
+async def test_add_property_facet_complete(tools, prime_session):
     """Test adding property facet with all fields."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_property_facet(
+    ctx = prime_session()
+    result = await tools.add_property_facet(
         spec_id="S1",
         location="requirements",
         property_name="LoadBearing",
-        ctx=mock_context,
+        ctx=ctx,
         property_set="Pset_WallCommon",
         data_type="IFCBOOLEAN",
         value="TRUE",
@@ -145,7 +133,7 @@ async def test_add_property_facet_complete(mock_context):
     assert result["status"] == "added"
 
     storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
+    spec = storage.get(ctx.session_id).ids_obj.specifications[0]
     prop = spec.requirements[0]
 
     assert prop.baseName == "LoadBearing"
@@ -156,90 +144,34 @@ async def test_add_property_facet_complete(mock_context):
 
 
 # Attribute Facet Tests
-@pytest.mark.asyncio
-async def test_add_attribute_facet(mock_context):
-    """Test adding attribute facet."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_attribute_facet(
-        spec_id="S1",
-        location="requirements",
-        attribute_name="Name",
-        ctx=mock_context,
-        value="External Wall"
-    )
-
-    assert result["status"] == "added"
-    assert result["facet_type"] == "attribute"
-
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    assert len(spec.requirements) == 1
-    assert isinstance(spec.requirements[0], ids.Attribute)
-    assert spec.requirements[0].name == "Name"
-    assert spec.requirements[0].value == "External Wall"
-
-
-@pytest.mark.asyncio
-async def test_add_attribute_facet_with_cardinality(mock_context):
+async def test_add_attribute_facet_with_cardinality(tools, prime_session):
     """Test adding attribute facet with cardinality."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_attribute_facet(
+    ctx = prime_session()
+    result = await tools.add_attribute_facet(
         spec_id="S1",
         location="requirements",
         attribute_name="Description",
-        ctx=mock_context,
+        ctx=ctx,
         cardinality="optional"
     )
 
     assert result["status"] == "added"
 
     storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
+    spec = storage.get(ctx.session_id).ids_obj.specifications[0]
     attr = spec.requirements[0]
     assert attr.cardinality == "optional"
 
 
 # Classification Facet Tests
-@pytest.mark.asyncio
-async def test_add_classification_facet(mock_context):
-    """Test adding classification facet."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_classification_facet(
-        spec_id="S1",
-        location="requirements",
-        classification_value="Ss_25_10_20",
-        ctx=mock_context,
-        classification_system="Uniclass"
-    )
-
-    assert result["status"] == "added"
-    assert result["facet_type"] == "classification"
-
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    assert len(spec.requirements) == 1
-    assert isinstance(spec.requirements[0], ids.Classification)
-    assert spec.requirements[0].value == "Ss_25_10_20"
-    assert spec.requirements[0].system == "Uniclass"
-
-
-@pytest.mark.asyncio
-async def test_add_classification_facet_with_uri(mock_context):
+async def test_add_classification_facet_with_uri(tools, prime_session):
     """Test adding classification with URI system."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_classification_facet(
+    ctx = prime_session()
+    result = await tools.add_classification_facet(
         spec_id="S1",
         location="applicability",
         classification_value="23.30.10",
-        ctx=mock_context,
+        ctx=ctx,
         classification_system="https://identifier.buildingsmart.org/uri/buildingsmart/ifc-4.3/class/IfcWall"
     )
 
@@ -247,88 +179,35 @@ async def test_add_classification_facet_with_uri(mock_context):
 
 
 # Material Facet Tests
-@pytest.mark.asyncio
-async def test_add_material_facet(mock_context):
-    """Test adding material facet."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_material_facet(
-        spec_id="S1",
-        location="requirements",
-        material_value="Concrete",
-        ctx=mock_context
-    )
-
-    assert result["status"] == "added"
-    assert result["facet_type"] == "material"
-
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    assert len(spec.requirements) == 1
-    assert isinstance(spec.requirements[0], ids.Material)
-    assert spec.requirements[0].value == "Concrete"
-
-
-@pytest.mark.asyncio
-async def test_add_material_facet_with_cardinality(mock_context):
+async def test_add_material_facet_with_cardinality(tools, prime_session):
     """Test adding material facet with cardinality."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_material_facet(
+    ctx = prime_session()
+    result = await tools.add_material_facet(
         spec_id="S1",
         location="requirements",
         material_value="Steel",
-        ctx=mock_context,
+        ctx=ctx,
         cardinality="prohibited"
     )
 
     assert result["status"] == "added"
 
     storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
+    spec = storage.get(ctx.session_id).ids_obj.specifications[0]
     material = spec.requirements[0]
     assert material.cardinality == "prohibited"
 
 
 # PartOf Facet Tests
-@pytest.mark.asyncio
-async def test_add_partof_facet(mock_context):
-    """Test adding partOf facet."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_partof_facet(
-        spec_id="S1",
-        location="applicability",
-        relation="IFCRELCONTAINEDINSPATIALSTRUCTURE",
-        parent_entity="IFCSPACE",
-        ctx=mock_context
-    )
-
-    assert result["status"] == "added"
-    assert result["facet_type"] == "partof"
-
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    assert len(spec.applicability) == 1
-    assert isinstance(spec.applicability[0], ids.PartOf)
-    assert spec.applicability[0].relation == "IFCRELCONTAINEDINSPATIALSTRUCTURE"
-
-
-@pytest.mark.asyncio
-async def test_add_partof_facet_with_predefined_type(mock_context):
+async def test_add_partof_facet_with_predefined_type(tools, prime_session):
     """Test adding partOf facet with parent predefined type."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    result = await add_partof_facet(
+    ctx = prime_session()
+    result = await tools.add_partof_facet(
         spec_id="S1",
         location="requirements",
         relation="IFCRELAGGREGATES",
         parent_entity="IFCBUILDING",
-        ctx=mock_context,
+        ctx=ctx,
         parent_predefined_type="RESIDENTIAL",
         cardinality="required"
     )
@@ -336,7 +215,7 @@ async def test_add_partof_facet_with_predefined_type(mock_context):
     assert result["status"] == "added"
 
     storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
+    spec = storage.get(ctx.session_id).ids_obj.specifications[0]
     part_of = spec.requirements[0]
     assert isinstance(part_of, ids.PartOf)
     assert part_of.predefinedType == "RESIDENTIAL"
@@ -344,14 +223,13 @@ async def test_add_partof_facet_with_predefined_type(mock_context):
 
 
 # Test finding specification by name
-@pytest.mark.asyncio
-async def test_facet_finds_spec_by_name(mock_context):
+async def test_facet_finds_spec_by_name(tools, mock_context):
     """Test that facets can find specification by name."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="My Specification", ifc_versions=["IFC4"], ctx=mock_context)
+    await tools.create_ids(title="Test IDS", ctx=mock_context)
+    await tools.add_specification(name="My Specification", ifc_versions=["IFC4"], ctx=mock_context)
 
     # Should find by name
-    result = await add_entity_facet(
+    result = await tools.add_entity_facet(
         spec_id="My Specification",
         location="applicability",
         entity_name="IFCWALL",
@@ -361,14 +239,13 @@ async def test_facet_finds_spec_by_name(mock_context):
     assert result["status"] == "added"
 
 
-@pytest.mark.asyncio
-async def test_facet_spec_not_found(mock_context):
+async def test_facet_spec_not_found(tools, mock_context):
     """Test that missing specification raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Spec 1", ifc_versions=["IFC4"], ctx=mock_context)
+    await tools.create_ids(title="Test IDS", ctx=mock_context)
+    await tools.add_specification(name="Spec 1", ifc_versions=["IFC4"], ctx=mock_context)
 
     with pytest.raises(ToolError) as exc_info:
-        await add_entity_facet(
+        await tools.add_entity_facet(
             spec_id="NonExistent",
             location="applicability",
             entity_name="IFCWALL",
@@ -379,40 +256,34 @@ async def test_facet_spec_not_found(mock_context):
 
 
 # Test combining multiple facets
-@pytest.mark.asyncio
-async def test_multiple_facets_same_specification(mock_context):
-    """Test adding multiple different facets to same specification."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
+async def _bulk_add(ctx, spec_id, ops):
+    """
+    Apply several facet tool calls to one specification.
 
-    # Add entity to applicability
-    await add_entity_facet(
-        spec_id="S1",
-        location="applicability",
-        entity_name="IFCWALL",
-        ctx=mock_context
-    )
+    Args:
+        ctx: Test context
+        spec_id: Specification identifier or name
+        ops: (facet_fn, location, kwargs) tuples, applied in order
 
-    # Add property to requirements
-    await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name="FireRating",
-        ctx=mock_context,
-        property_set="Pset_WallCommon"
-    )
+    Returns:
+        The specification, looked up from storage once after all calls
+    """
+    for facet_fn, location, kwargs in ops:
+        await facet_fn(spec_id=spec_id, location=location, ctx=ctx, **kwargs)
+    return get_session_storage().get(ctx.session_id).ids_obj.specifications[0]
 
-    # Add material to requirements
-    await add_material_facet(
-        spec_id="S1",
-        location="requirements",
-        material_value="Concrete",
-        ctx=mock_context
-    )
 
-    # Verify all facets added
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
+async def test_multiple_facets_same_specification(tools, prime_session):
+    """Test adding multiple different facets to same specification."""
+    ctx = prime_session()
+    spec = await _bulk_add(ctx, "S1", [
+        (tools.add_entity_facet, "applicability", {"entity_name": "IFCWALL"}),
+        (
+            tools.add_property_facet, "requirements",
+            {"property_name": "FireRating", "property_set": "Pset_WallCommon"}
+        ),
+        (tools.add_material_facet, "requirements", {"material_value": "Concrete"}),
+    ])
 
     assert len(spec.applicability) == 1
     assert len(spec.requirements) == 2
@@ -422,14 +293,13 @@ async def test_multiple_facets_same_specification(mock_context):
 
 
 # Error handling tests for facets
-@pytest.mark.asyncio
-async def test_entity_facet_generic_error(mock_context):
+async def test_entity_facet_generic_error(tools, mock_context):
     """Test entity facet handles generic errors."""
-    await create_ids(title="Test IDS", ctx=mock_context)
+    await tools.create_ids(title="Test IDS", ctx=mock_context)
 
     # Try to add facet to non-existent spec
     with pytest.raises(ToolError) as exc_info:
-        await add_entity_facet(
+        await tools.add_entity_facet(
             spec_id="NonExistent",
             location="applicability",
             entity_name="IFCWALL",
@@ -439,149 +309,89 @@ async def test_entity_facet_generic_error(mock_context):
     assert "Specification not found" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
-async def test_property_facet_invalid_location_error(mock_context):
-    """Test property facet with invalid location."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    with pytest.raises(ToolError) as exc_info:
-        await add_property_facet(
-            spec_id="S1",
-            location="invalid_location",
-            property_name="FireRating",
-            ctx=mock_context,
-            property_set="Pset_WallCommon"
-        )
-
-    assert "Invalid location" in str(exc_info.value)
-
-
-@pytest.mark.asyncio
-async def test_attribute_facet_invalid_location_error(mock_context):
-    """Test attribute facet with invalid location."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    with pytest.raises(ToolError) as exc_info:
-        await add_attribute_facet(
-            spec_id="S1",
-            location="wrong",
-            attribute_name="Name",
-            ctx=mock_context
-        )
-
-    assert "Invalid location" in str(exc_info.value)
-
-
-@pytest.mark.asyncio
-async def test_classification_facet_invalid_location_error(mock_context):
-    """Test classification facet with invalid location."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
+@pytest.mark.parametrize(
+    "facet_name,kwargs",
+    [
+        ("add_entity_facet", {"entity_name": "IFCWALL"}),
+        ("add_property_facet", {"property_name": "FireRating", "property_set": "Pset_WallCommon"}),
+        ("add_attribute_facet", {"attribute_name": "Name"}),
+        ("add_classification_facet", {"classification_value": "Test"}),
+        ("add_material_facet", {"material_value": "Concrete"}),
+    ],
+    ids=["entity", "property", "attribute", "classification", "material"]
+)
+async def test_facet_invalid_location(tools, facet_name, kwargs, prime_session):
+    """Test that every facet tool rejects an invalid location."""
+    ctx = prime_session()
     with pytest.raises(ToolError) as exc_info:
-        await add_classification_facet(
-            spec_id="S1",
-            location="other",
-            classification_value="Test",
-            ctx=mock_context
-        )
-
-    assert "Invalid location" in str(exc_info.value)
-
-
-@pytest.mark.asyncio
-async def test_material_facet_invalid_location_error(mock_context):
-    """Test material facet with invalid location."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    with pytest.raises(ToolError) as exc_info:
-        await add_material_facet(
-            spec_id="S1",
-            location="somewhere",
-            material_value="Concrete",
-            ctx=mock_context
-        )
+        await getattr(tools, facet_name)(spec_id="S1", location="invalid", ctx=ctx, **kwargs)
 
     assert "Invalid location" in str(exc_info.value)
 
 
 # Validation Error Tests (IDS 1.0 Constraints)
-@pytest.mark.asyncio
-async def test_add_second_entity_facet_to_applicability_raises_error(mock_context):
+async def test_add_second_entity_facet_to_applicability_raises_error(tools, prime_session):
     """Test that adding second entity facet to applicability raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
+    ctx = prime_session()
     # First entity - should succeed
-    await add_entity_facet(
+    await tools.add_entity_facet(
         spec_id="S1",
         location="applicability",
         entity_name="IFCWALL",
-        ctx=mock_context
+        ctx=ctx
     )
 
     # Second entity - should fail with clear error
     with pytest.raises(ToolError) as exc_info:
-        await add_entity_facet(
+        await tools.add_entity_facet(
             spec_id="S1",
             location="applicability",
             entity_name="IFCDOOR",
-            ctx=mock_context
+            ctx=ctx
         )
 
     error_msg = str(exc_info.value)
-    assert "IDS 1.0 XSD constraint violation" in error_msg
-    assert "Only ONE entity facet" in error_msg
-    assert "WORKAROUND" in error_msg
-    assert "separate specification" in error_msg
+    missing = [m for m in _ENTITY_ERR_MARKERS if m not in error_msg]
+    assert not missing, missing
 
 
-@pytest.mark.asyncio
-async def test_add_multiple_entity_facets_to_requirements_allowed(mock_context):
+async def test_add_multiple_entity_facets_to_requirements_allowed(tools, prime_session):
     """Test that multiple entity facets in requirements is allowed."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
+    ctx = prime_session()
     # Multiple entity facets in requirements - should succeed
-    await add_entity_facet(
+    await tools.add_entity_facet(
         spec_id="S1",
         location="requirements",
         entity_name="IFCWALL",
-        ctx=mock_context
+        ctx=ctx
     )
 
-    await add_entity_facet(
+    await tools.add_entity_facet(
         spec_id="S1",
         location="requirements",
         entity_name="IFCDOOR",
-        ctx=mock_context
+        ctx=ctx
     )
 
     # Verify both added
     storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
+    spec = storage.get(ctx.session_id).ids_obj.specifications[0]
     assert len(spec.requirements) == 2
     assert isinstance(spec.requirements[0], ids.Entity)
     assert isinstance(spec.requirements[1], ids.Entity)
 
 
-@pytest.mark.asyncio
-async def test_add_property_facet_without_property_set_raises_error(mock_context):
-    """Test that property facet without property_set raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Try to add property without property_set
+@pytest.mark.parametrize("bad_pset", [None, ""], ids=["missing", "empty"])
+async def test_add_property_facet_property_set_required(tools, prime_session, bad_pset):
+    """Test that property facet without a property_set raises error."""
+    ctx = prime_session()
     with pytest.raises(ToolError) as exc_info:
-        await add_property_facet(
+        await tools.add_property_facet(
             spec_id="S1",
             location="requirements",
             property_name="FireRating",
-            ctx=mock_context,
-            property_set=None  # Missing!
+            ctx=ctx,
+            property_set=bad_pset
         )
 
     error_msg = str(exc_info.value)
@@ -589,47 +399,3 @@ async def test_add_property_facet_without_property_set_raises_error(mock_context
     assert "required" in error_msg.lower()
     assert "COMMON PROPERTY SETS" in error_msg
     assert "Pset_WallCommon" in error_msg
-
-
-@pytest.mark.asyncio
-async def test_add_property_facet_with_empty_property_set_raises_error(mock_context):
-    """Test that property facet with empty property_set raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Try to add property with empty property_set
-    with pytest.raises(ToolError) as exc_info:
-        await add_property_facet(
-            spec_id="S1",
-            location="requirements",
-            property_name="FireRating",
-            ctx=mock_context,
-            property_set=""  # Empty!
-        )
-
-    assert "property_set" in str(exc_info.value).lower()
-
-
-@pytest.mark.asyncio
-async def test_add_property_facet_with_property_set_succeeds(mock_context):
-    """Test that property facet with property_set succeeds."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Add property with proper property_set
-    result = await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name="FireRating",
-        ctx=mock_context,
-        property_set="Pset_WallCommon"  # Provided!
-    )
-
-    assert result["status"] == "added"
-
-    # Verify in session
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    prop = spec.requirements[0]
-    assert prop.baseName == "FireRating"
-    assert prop.propertySet == "Pset_WallCommon"
@@ -1,212 +1,212 @@
 """Tests for IDS-Audit-tool integration."""
 
+import subprocess
+from subprocess import CompletedProcess
+
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
-from ids_mcp_server.tools.ids_audit_tool import get_audit_tool_path, run_audit_tool
+from unittest.mock import Mock
+from ids_mcp_server.tools.ids_audit_tool import (
+    _locate_audit_tool,
+    get_audit_tool_path,
+    run_audit_tool,
+)
 from ids_mcp_server.config import AuditToolConfig
 
 
-@patch("ids_mcp_server.tools.ids_audit_tool.Path")
-def test_get_audit_tool_path_exists(mock_path_class, tmp_path):
-    """Test getting audit tool path when it exists in bin/ directory."""
-    # Create mock tool directory structure with bin/ subdirectory
-    tools_dir = tmp_path / "tools" / "ids-audit-tool" / "bin"
-    tools_dir.mkdir(parents=True)
-    tool_exe = tools_dir / "ids-tool.exe"
-    tool_exe.write_text("mock exe")
+@pytest.fixture(scope="module")
+def audit_files(tmp_path_factory):
+    """Paths for a mock ids-tool.exe and IDS file; nothing is written to disk."""
+    root = tmp_path_factory.getbasetemp() / "audit"
+    return root / "ids-tool.exe", root / "test.ids"
 
-    # Mock __file__ path resolution
-    mock_file_path = MagicMock()
-    mock_file_path.parent.parent.parent.parent = tmp_path
-    mock_path_class.return_value = mock_file_path
 
-    result = get_audit_tool_path()
+@pytest.fixture
+def fake_paths(monkeypatch):
+    """Answer Path.exists/is_file/is_dir from in-memory sets instead of the disk."""
+    files, dirs = set(), set()
+    monkeypatch.setattr(Path, "exists", lambda self: self in files or self in dirs)
+    monkeypatch.setattr(Path, "is_file", lambda self: self in files)
+    monkeypatch.setattr(Path, "is_dir", lambda self: self in dirs)
+    return files, dirs
 
-    assert result == tool_exe
 
+@pytest.fixture(autouse=True)
+def clear_audit_tool_path_cache():
+    """Keep cached tool path lookups from leaking between tests."""
+    _locate_audit_tool.cache_clear()
+    yield
+    _locate_audit_tool.cache_clear()
 
-@patch("ids_mcp_server.tools.ids_audit_tool.Path")
-def test_get_audit_tool_path_not_found(mock_path_class, tmp_path):
-    """Test getting audit tool path when it doesn't exist."""
-    # Mock __file__ path resolution
-    mock_file_path = MagicMock()
-    mock_file_path.parent.parent.parent.parent = tmp_path
-    mock_path_class.return_value = mock_file_path
 
-    result = get_audit_tool_path()
+def _r(rc, out="", err=""):
+    """Build a CompletedProcess-specced stand-in for a subprocess.run result."""
+    return Mock(spec=CompletedProcess, returncode=rc, stdout=out, stderr=err)
 
-    assert result is None
 
+def test_get_audit_tool_path_exists(monkeypatch, audit_files, fake_paths):
+    """Test getting audit tool path when it exists in bin/ directory."""
+    root = audit_files[0].parent
+    tool_exe = root / "tools" / "ids-audit-tool" / "bin" / "ids-tool.exe"
+    fake_paths[0].add(tool_exe)
+    monkeypatch.setattr("ids_mcp_server.tools.ids_audit_tool._REPO_ROOT", root)
 
-@patch("ids_mcp_server.tools.ids_audit_tool.get_audit_tool_path")
-@patch("ids_mcp_server.tools.ids_audit_tool.subprocess.run")
-def test_run_audit_tool_success(mock_subprocess, mock_get_path, tmp_path):
-    """Test running audit tool successfully."""
-    tool_path = tmp_path / "ids-tool.exe"
-    tool_path.write_text("mock")
-    mock_get_path.return_value = tool_path
+    result = get_audit_tool_path()
 
-    ids_file = tmp_path / "test.ids"
-    ids_file.write_text("<?xml version='1.0'?><ids></ids>")
+    assert result == tool_exe
 
-    # Mock successful subprocess run
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = "Validation successful"
-    mock_result.stderr = ""
-    mock_subprocess.return_value = mock_result
 
-    result = run_audit_tool(str(ids_file))
+def test_get_audit_tool_path_not_found(monkeypatch, audit_files, fake_paths):
+    """Test getting audit tool path when it doesn't exist."""
+    monkeypatch.setattr("ids_mcp_server.tools.ids_audit_tool._REPO_ROOT", audit_files[0].parent)
 
-    assert result["valid"] is True
-    assert result["exit_code"] == 0
-    assert "Validation successful" in result["output"]
-    assert result["errors"] == []
-    mock_subprocess.assert_called_once()
+    result = get_audit_tool_path()
 
+    assert result is None
 
-@patch("ids_mcp_server.tools.ids_audit_tool.get_audit_tool_path")
-@patch("ids_mcp_server.tools.ids_audit_tool.subprocess.run")
-def test_run_audit_tool_with_errors(mock_subprocess, mock_get_path, tmp_path):
-    """Test running audit tool with errors."""
-    tool_path = tmp_path / "ids-tool.exe"
-    tool_path.write_text("mock")
-    mock_get_path.return_value = tool_path
 
-    ids_file = tmp_path / "test.ids"
-    ids_file.write_text("<?xml version='1.0'?><ids></ids>")
+def test_get_audit_tool_path_with_custom_file_path(audit_files, fake_paths):
+    """Test getting audit tool path with custom file path in config."""
+    custom_tool, _ = audit_files
+    fake_paths[0].add(custom_tool)
 
-    # Mock failed subprocess run
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stdout = ""
-    mock_result.stderr = "Error: Invalid IDS structure"
-    mock_subprocess.return_value = mock_result
+    config = AuditToolConfig(path=str(custom_tool))
+    result = get_audit_tool_path(config)
 
-    result = run_audit_tool(str(ids_file))
+    assert result == custom_tool
 
-    assert result["valid"] is False
-    assert result["exit_code"] == 1
-    assert len(result["errors"]) > 0
 
+def test_get_audit_tool_path_with_custom_dir_path(audit_files, fake_paths):
+    """Test getting audit tool path with custom directory path in config."""
+    custom_tool, _ = audit_files
+    custom_dir = custom_tool.parent
+    files, dirs = fake_paths
+    files.add(custom_tool)
+    dirs.add(custom_dir)
 
-@patch("ids_mcp_server.tools.ids_audit_tool.get_audit_tool_path")
-def test_run_audit_tool_tool_not_found(mock_get_path):
-    """Test running audit tool when tool is not found."""
-    mock_get_path.return_value = None
+    config = AuditToolConfig(path=str(custom_dir))
+    result = get_audit_tool_path(config)
 
-    result = run_audit_tool("test.ids")
+    assert result == custom_tool
 
-    assert result["valid"] is False
-    assert result["exit_code"] == -1
-    assert "not found" in result["errors"][0].lower()
 
+def test_get_audit_tool_path_is_cached(audit_files, fake_paths):
+    """Test that repeated lookups with an equal config hit the cache."""
+    custom_tool, _ = audit_files
+    fake_paths[0].add(custom_tool)
 
-@patch("ids_mcp_server.tools.ids_audit_tool.get_audit_tool_path")
-def test_run_audit_tool_file_not_found(mock_get_path, tmp_path):
-    """Test running audit tool when IDS file doesn't exist."""
-    tool_path = tmp_path / "ids-tool.exe"
-    tool_path.write_text("mock")
-    mock_get_path.return_value = tool_path
+    first = get_audit_tool_path(AuditToolConfig(path=str(custom_tool)))
+    second = get_audit_tool_path(AuditToolConfig(path=str(custom_tool)))
 
-    result = run_audit_tool("nonexistent.ids")
+    assert first == second == custom_tool
+    assert _locate_audit_tool.cache_info().hits == 1
 
-    assert result["valid"] is False
-    assert result["exit_code"] == -1
-    assert "not found" in result["errors"][0].lower()
 
+def test_get_audit_tool_path_miss_is_not_cached(monkeypatch, audit_files, fake_paths):
+    """Test that a tool installed after a failed lookup is found by the next lookup."""
+    root = audit_files[0].parent
+    tool_exe = root / "tools" / "ids-audit-tool" / "bin" / "ids-tool.exe"
+    monkeypatch.setattr("ids_mcp_server.tools.ids_audit_tool._REPO_ROOT", root)
 
-@patch("ids_mcp_server.tools.ids_audit_tool.get_audit_tool_path")
-@patch("ids_mcp_server.tools.ids_audit_tool.subprocess.run")
-def test_run_audit_tool_timeout(mock_subprocess, mock_get_path, tmp_path):
-    """Test running audit tool with timeout."""
-    import subprocess
+    assert get_audit_tool_path() is None
 
-    tool_path = tmp_path / "ids-tool.exe"
-    tool_path.write_text("mock")
-    mock_get_path.return_value = tool_path
+    fake_paths[0].add(tool_exe)
 
-    ids_file = tmp_path / "test.ids"
-    ids_file.write_text("<?xml version='1.0'?><ids></ids>")
+    assert get_audit_tool_path() == tool_exe
 
-    # Mock timeout exception
-    mock_subprocess.side_effect = subprocess.TimeoutExpired("ids-tool.exe", 30)
 
-    result = run_audit_tool(str(ids_file))
+class TestRunAuditTool:
+    """Tests for run_audit_tool with the tool lookup and subprocess patched."""
 
-    assert result["valid"] is False
-    assert result["exit_code"] == -1
-    assert "timed out" in result["errors"][0].lower()
+    @pytest.fixture(autouse=True)
+    def patch_tool(self, mocker, audit_files, fake_paths):
+        """Patch tool lookup and subprocess.run once for every test in the class."""
+        self.tool_path, self.ids_file = audit_files
+        fake_paths[0].update(audit_files)
+        self.get_path = mocker.patch(
+            "ids_mcp_server.tools.ids_audit_tool.get_audit_tool_path",
+            return_value=self.tool_path
+        )
+        self.run = mocker.patch("ids_mcp_server.tools.ids_audit_tool.subprocess.run")
 
+    def test_success(self):
+        """Test running audit tool successfully."""
+        calls = []
 
-@patch("ids_mcp_server.tools.ids_audit_tool.get_audit_tool_path")
-@patch("ids_mcp_server.tools.ids_audit_tool.subprocess.run")
-def test_run_audit_tool_exception(mock_subprocess, mock_get_path, tmp_path):
-    """Test running audit tool with exception."""
-    tool_path = tmp_path / "ids-tool.exe"
-    tool_path.write_text("mock")
-    mock_get_path.return_value = tool_path
+        def _run(*args, **kwargs):
+            calls.append((args, kwargs))
+            return _r(0, "Validation successful", "")
 
-    ids_file = tmp_path / "test.ids"
-    ids_file.write_text("<?xml version='1.0'?><ids></ids>")
+        self.run.side_effect = _run
 
-    # Mock exception
-    mock_subprocess.side_effect = Exception("Unexpected error")
+        result = run_audit_tool(str(self.ids_file))
 
-    result = run_audit_tool(str(ids_file))
+        assert result["valid"] is True
+        assert result["exit_code"] == 0
+        assert "Validation successful" in result["output"]
+        assert result["errors"] == []
+        assert len(calls) == 1
+        args, kwargs = calls[0]
+        assert args[0] == [str(self.tool_path), "audit", str(self.ids_file)]
+        assert kwargs["cwd"] == str(self.tool_path.parent)
 
-    assert result["valid"] is False
-    assert result["exit_code"] == -1
-    assert "Error executing" in result["errors"][0]
+    def test_with_errors(self):
+        """Test running audit tool with errors."""
+        self.run.return_value = _r(1, "", "Error: Invalid IDS structure")
 
+        result = run_audit_tool(str(self.ids_file))
 
-def test_get_audit_tool_path_with_custom_file_path(tmp_path):
-    """Test getting audit tool path with custom file path in config."""
-    custom_tool = tmp_path / "custom-ids-tool.exe"
-    custom_tool.write_text("mock")
+        assert result["valid"] is False
+        assert result["exit_code"] == 1
+        assert len(result["errors"]) > 0
 
-    config = AuditToolConfig(path=str(custom_tool))
-    result = get_audit_tool_path(config)
+    def test_tool_not_found(self):
+        """Test running audit tool when tool is not found."""
+        self.get_path.return_value = None
 
-    assert result == custom_tool
+        result = run_audit_tool("test.ids")
 
+        assert result["valid"] is False
+        assert result["exit_code"] == -1
+        assert "not found" in result["errors"][0].lower()
+        self.run.assert_not_called()
 
-def test_get_audit_tool_path_with_custom_dir_path(tmp_path):
-    """Test getting audit tool path with custom directory path in config."""
-    custom_dir = tmp_path / "custom-tool-dir"
-    custom_dir.mkdir()
-    custom_tool = custom_dir / "ids-tool.exe"
-    custom_tool.write_text("mock")
+    def test_file_not_found(self):
+        """Test running audit tool when IDS file doesn't exist."""
+        result = run_audit_tool("nonexistent.ids")
 
-    config = AuditToolConfig(path=str(custom_dir))
-    result = get_audit_tool_path(config)
+        assert result["valid"] is False
+        assert result["exit_code"] == -1
+        assert "not found" in result["errors"][0].lower()
+        self.run.assert_not_called()
 
-    assert result == custom_tool
+    def test_timeout(self):
+        """Test running audit tool with timeout."""
+        self.run.side_effect = subprocess.TimeoutExpired("ids-tool.exe", 30)
 
+        result = run_audit_tool(str(self.ids_file))
 
-@patch("ids_mcp_server.tools.ids_audit_tool.get_audit_tool_path")
-@patch("ids_mcp_server.tools.ids_audit_tool.subprocess.run")
-def test_run_audit_tool_with_config(mock_subprocess, mock_get_path, tmp_path):
-    """Test running audit tool with config parameter."""
-    tool_path = tmp_path / "ids-tool.exe"
-    tool_path.write_text("mock")
-    mock_get_path.return_value = tool_path
+        assert result["valid"] is False
+        assert result["exit_code"] == -1
+        assert "timed out" in result["errors"][0].lower()
 
-    ids_file = tmp_path / "test.ids"
-    ids_file.write_text("<?xml version='1.0'?><ids></ids>")
+    def test_exception(self):
+        """Test running audit tool with exception."""
+        self.run.side_effect = Exception("Unexpected error")
 
-    config = AuditToolConfig(enabled=True, path=str(tmp_path))
+        result = run_audit_tool(str(self.ids_file))
 
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = "Success"
-    mock_result.stderr = ""
-    mock_subprocess.return_value = mock_result
+        assert result["valid"] is False
+        assert result["exit_code"] == -1
+        assert "Error executing" in result["errors"][0]
 
-    result = run_audit_tool(str(ids_file), config)
+    def test_with_config(self):
+        """Test running audit tool with config parameter."""
+        config = AuditToolConfig(enabled=True, path=str(self.tool_path.parent))
+        self.run.return_value = _r(0, "Success", "")
 
-    assert result["valid"] is True
-    # Verify config was passed to get_audit_tool_path
-    mock_get_path.assert_called_once_with(config)
+        result = run_audit_tool(str(self.ids_file), config)
 
+        assert result["valid"] is True
+        # Verify config was passed to get_audit_tool_path
+        self.get_path.assert_called_once_with(config)
@@ -1,44 +1,55 @@
 """RED: Tests for restriction management tools."""
 
+from unittest.mock import AsyncMock
+
 import pytest
+import pytest_asyncio
 from ifctester import ids
-from ids_mcp_server.tools.restrictions import (
-    add_enumeration_restriction,
-    add_pattern_restriction,
-    add_bounds_restriction,
-    add_length_restriction
-)
-from ids_mcp_server.tools.document import create_ids
-from ids_mcp_server.tools.specification import add_specification
-from ids_mcp_server.tools.facets import add_property_facet, add_attribute_facet, add_entity_facet
+from ids_mcp_server.tools import restrictions as R, document as D
 from ids_mcp_server.session.storage import get_session_storage
 from fastmcp.exceptions import ToolError
 
+pytestmark = pytest.mark.usefixtures("fresh_tool_session", "no_leaked_tasks")
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def _warm_export(build_test_ids, install_ids):
+    """Run one throwaway export so serializer start-up cost lands in setup, not a random test."""
+    ctx = AsyncMock(session_id="warm-export")
+    install_ids(ctx.session_id, build_test_ids(with_entity=True))
+    try:
+        await D.export_ids(ctx=ctx, validate=False)
+    finally:
+        # Plain removal from storage; nothing else holds on to the session
+        get_session_storage().delete(ctx.session_id)
+
+
+def _assert_all_in(xml, needles):
+    """
+    Assert every needle occurs in xml.
+
+    Args:
+        xml: Exported XML string
+        needles: Substrings to find; a tuple entry passes if any of its alternatives occurs
+    """
+    groups = [(needle,) if isinstance(needle, str) else needle for needle in needles]
+    missing = [g for g in groups if not any(a in xml for a in g)]
+    assert not missing, missing
+
 
 # Enumeration Restriction Tests
-@pytest.mark.asyncio
-async def test_add_enumeration_restriction_to_property(mock_context):
+async def test_add_enumeration_restriction_to_property(prime_session, get_first_requirement):
     """Test adding enumeration restriction to property facet."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Add property facet to requirements
-    await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name="FireRating",
-        ctx=mock_context,
-        property_set="Pset_WallCommon"
-    )
+    ctx = prime_session(with_property=True)
 
     # Add enumeration restriction to property value
-    result = await add_enumeration_restriction(
+    result = await R.add_enumeration_restriction(
         spec_id="S1",
         facet_index=0,
         parameter_name="value",
         base_type="xs:string",
         values=["REI30", "REI60", "REI90"],
-        ctx=mock_context,
+        ctx=ctx,
         location="requirements"
     )
 
@@ -46,9 +57,7 @@ async def test_add_enumeration_restriction_to_property(mock_context):
     assert result["restriction_type"] == "enumeration"
 
     # Verify restriction with IfcTester
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    prop = spec.requirements[0]
+    prop = get_first_requirement()
 
     assert isinstance(prop.value, ids.Restriction)
     # IfcTester stores base without 'xs:' prefix internally
@@ -57,101 +66,25 @@ async def test_add_enumeration_restriction_to_property(mock_context):
     assert hasattr(prop.value, "enumeration") or "enumeration" in getattr(prop.value, "options", {})
 
 
-@pytest.mark.asyncio
-async def test_enumeration_restriction_exports_to_xml(mock_context):
-    """Test that enumeration restriction exports to valid XML."""
-    from ids_mcp_server.tools.document import export_ids
-
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Add entity to applicability (required by IDS XSD)
-    await add_entity_facet(
-        spec_id="S1",
-        location="applicability",
-        entity_name="IFCWALL",
-        ctx=mock_context
-    )
-
-    await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name="LoadBearing",
-        ctx=mock_context,
-        property_set="Pset_WallCommon"
-    )
-
-    await add_enumeration_restriction(
-        spec_id="S1",
-        facet_index=0,
-        parameter_name="value",
-        base_type="xs:string",
-        values=["TRUE", "FALSE"],
-        ctx=mock_context
-    )
-
-    # Export to XML (skip XSD validation due to IfcTester namespace bug)
-    result = await export_ids(ctx=mock_context, validate=False)
-
-    # Verify XML contains restriction elements
-    assert result["status"] == "exported"
-    assert "<xs:restriction" in result["xml"]
-    assert "<xs:enumeration" in result["xml"]
-    assert 'value="TRUE"' in result["xml"]
-    assert 'value="FALSE"' in result["xml"]
-
-
-@pytest.mark.asyncio
-async def test_enumeration_restriction_invalid_facet_index(mock_context):
-    """Test that invalid facet index raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Don't add any facets
-
-    with pytest.raises(ToolError) as exc_info:
-        await add_enumeration_restriction(
-            spec_id="S1",
-            facet_index=0,
-            parameter_name="value",
-            base_type="xs:string",
-            values=["A", "B"],
-            ctx=mock_context
-        )
-
-    assert "facet index" in str(exc_info.value).lower() or "out of range" in str(exc_info.value).lower()
-
-
 # Pattern Restriction Tests
-@pytest.mark.asyncio
-async def test_add_pattern_restriction_to_attribute(mock_context):
+async def test_add_pattern_restriction_to_attribute(prime_session, get_first_requirement):
     """Test adding pattern restriction to attribute facet."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
+    ctx = prime_session(with_attribute=True)
 
-    await add_attribute_facet(
-        spec_id="S1",
-        location="requirements",
-        attribute_name="Name",
-        ctx=mock_context
-    )
-
-    result = await add_pattern_restriction(
+    result = await R.add_pattern_restriction(
         spec_id="S1",
         facet_index=0,
         parameter_name="value",
         base_type="xs:string",
         pattern="EW-[0-9]{3}",
-        ctx=mock_context
+        ctx=ctx
     )
 
     assert result["status"] == "added"
     assert result["restriction_type"] == "pattern"
 
     # Verify with IfcTester
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    attr = spec.requirements[0]
+    attr = get_first_requirement()
 
     assert isinstance(attr.value, ids.Restriction)
     # IfcTester stores base without 'xs:' prefix internally
@@ -160,70 +93,17 @@ async def test_add_pattern_restriction_to_attribute(mock_context):
     assert hasattr(attr.value, "pattern") or "pattern" in getattr(attr.value, "options", {})
 
 
-@pytest.mark.asyncio
-async def test_pattern_restriction_exports_to_xml(mock_context):
-    """Test that pattern restriction exports to valid XML."""
-    from ids_mcp_server.tools.document import export_ids
-
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Add entity to applicability (required by IDS XSD)
-    await add_entity_facet(
-        spec_id="S1",
-        location="applicability",
-        entity_name="IFCWALL",
-        ctx=mock_context
-    )
-
-    await add_attribute_facet(
-        spec_id="S1",
-        location="requirements",
-        attribute_name="Tag",
-        ctx=mock_context
-    )
-
-    await add_pattern_restriction(
-        spec_id="S1",
-        facet_index=0,
-        parameter_name="value",
-        base_type="xs:string",
-        pattern="[A-Z]{2}-[0-9]{4}",
-        ctx=mock_context
-    )
-
-    # Export to XML (skip XSD validation due to IfcTester namespace bug)
-    result = await export_ids(ctx=mock_context, validate=False)
-
-    # Verify XML contains restriction elements
-    assert result["status"] == "exported"
-    assert "<xs:restriction" in result["xml"]
-    assert "<xs:pattern" in result["xml"]
-    assert 'value="[A-Z]{2}-[0-9]{4}"' in result["xml"]
-
-
 # Bounds Restriction Tests
-@pytest.mark.asyncio
-async def test_add_bounds_restriction_min_max_inclusive(mock_context):
+async def test_add_bounds_restriction_min_max_inclusive(prime_session, get_first_requirement):
     """Test adding bounds restriction with min/max inclusive."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
+    ctx = prime_session(with_property=True)
 
-    await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name="Height",
-        ctx=mock_context,
-        property_set="Pset_WallCommon",
-        data_type="IFCREAL"
-    )
-
-    result = await add_bounds_restriction(
+    result = await R.add_bounds_restriction(
         spec_id="S1",
         facet_index=0,
         parameter_name="value",
         base_type="xs:double",
-        ctx=mock_context,
+        ctx=ctx,
         min_inclusive=2.4,
         max_inclusive=3.0
     )
@@ -232,9 +112,7 @@ async def test_add_bounds_restriction_min_max_inclusive(mock_context):
     assert result["restriction_type"] == "bounds"
 
     # Verify with IfcTester
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    prop = spec.requirements[0]
+    prop = get_first_requirement()
 
     assert isinstance(prop.value, ids.Restriction)
     # IfcTester stores base without 'xs:' prefix internally
@@ -245,105 +123,17 @@ async def test_add_bounds_restriction_min_max_inclusive(mock_context):
     assert "maxInclusive" in options or hasattr(prop.value, "maxInclusive")
 
 
-@pytest.mark.asyncio
-async def test_add_bounds_restriction_exclusive(mock_context):
-    """Test adding bounds restriction with exclusive bounds."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name="Temperature",
-        ctx=mock_context,
-        property_set="Pset_Common",
-        data_type="IFCREAL"
-    )
-
-    result = await add_bounds_restriction(
-        spec_id="S1",
-        facet_index=0,
-        parameter_name="value",
-        base_type="xs:double",
-        ctx=mock_context,
-        min_exclusive=0.0,
-        max_exclusive=100.0
-    )
-
-    assert result["status"] == "added"
-
-    # Verify with IfcTester
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    prop = spec.requirements[0]
-
-    assert isinstance(prop.value, ids.Restriction)
-
-
-@pytest.mark.asyncio
-async def test_bounds_restriction_exports_to_xml(mock_context):
-    """Test that bounds restriction exports to valid XML."""
-    from ids_mcp_server.tools.document import export_ids
-
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Add entity to applicability (required by IDS XSD)
-    await add_entity_facet(
-        spec_id="S1",
-        location="applicability",
-        entity_name="IFCWALL",
-        ctx=mock_context
-    )
-
-    await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name="Width",
-        ctx=mock_context,
-        property_set="Pset_WallCommon",
-        data_type="IFCREAL"
-    )
-
-    await add_bounds_restriction(
-        spec_id="S1",
-        facet_index=0,
-        parameter_name="value",
-        base_type="xs:double",
-        ctx=mock_context,
-        min_inclusive=0.1,
-        max_inclusive=0.5
-    )
-
-    # Export to XML (skip XSD validation due to IfcTester namespace bug)
-    result = await export_ids(ctx=mock_context, validate=False)
-
-    # Verify XML contains restriction elements
-    assert result["status"] == "exported"
-    assert "<xs:restriction" in result["xml"]
-    assert "<xs:minInclusive" in result["xml"] or "<xs:maxInclusive" in result["xml"]
-
-
 # Length Restriction Tests
-@pytest.mark.asyncio
-async def test_add_length_restriction_min_max(mock_context):
+async def test_add_length_restriction_min_max(prime_session, get_first_requirement):
     """Test adding length restriction with min/max."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
+    ctx = prime_session(with_attribute=True)
 
-    await add_attribute_facet(
-        spec_id="S1",
-        location="requirements",
-        attribute_name="Description",
-        ctx=mock_context
-    )
-
-    result = await add_length_restriction(
+    result = await R.add_length_restriction(
         spec_id="S1",
         facet_index=0,
         parameter_name="value",
         base_type="xs:string",
-        ctx=mock_context,
+        ctx=ctx,
         min_length=5,
         max_length=50
     )
@@ -352,152 +142,173 @@ async def test_add_length_restriction_min_max(mock_context):
     assert result["restriction_type"] == "length"
 
     # Verify with IfcTester
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    attr = spec.requirements[0]
+    attr = get_first_requirement()
 
     assert isinstance(attr.value, ids.Restriction)
     # IfcTester stores base without 'xs:' prefix internally
     assert attr.value.base == "string"
 
 
-@pytest.mark.asyncio
-async def test_add_length_restriction_exact(mock_context):
-    """Test adding exact length restriction."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
+@pytest.fixture(scope="class")
+def status_only_ctx():
+    """One context for the whole TestStatusOnly class, on its own session id."""
+    return AsyncMock(session_id="restriction-status-only")
 
-    await add_attribute_facet(
-        spec_id="S1",
-        location="requirements",
-        attribute_name="Tag",
-        ctx=mock_context
-    )
 
-    result = await add_length_restriction(
-        spec_id="S1",
-        facet_index=0,
-        parameter_name="value",
-        base_type="xs:string",
-        ctx=mock_context,
-        length=10
-    )
+@pytest.fixture(scope="class")
+def _status_only_ids(build_test_ids):
+    """Build spec "S1" once, with a property (facet 0) and an attribute (facet 1) requirement."""
+    return build_test_ids(with_property=True, with_attribute=True)
 
-    assert result["status"] == "added"
 
+@pytest.fixture
+def _status_only_session(status_only_ctx, _status_only_ids, install_ids):
+    """Re-register the shared IDS, since cleanup_sessions clears storage after every test."""
+    install_ids(status_only_ctx.session_id, _status_only_ids)
+    return status_only_ctx
 
-@pytest.mark.asyncio
-async def test_length_restriction_exports_to_xml(mock_context):
-    """Test that length restriction exports to valid XML."""
-    from ids_mcp_server.tools.document import export_ids
 
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
+@pytest.mark.usefixtures("_status_only_session")
+class TestStatusOnly:
+    """Restriction tools whose returned status is all that is checked, sharing one IDS."""
 
-    # Add entity to applicability (required by IDS XSD)
-    await add_entity_facet(
-        spec_id="S1",
-        location="applicability",
-        entity_name="IFCWALL",
-        ctx=mock_context
-    )
+    async def test_add_bounds_restriction_exclusive(self, status_only_ctx):
+        """Test adding bounds restriction with exclusive bounds."""
+        result = await R.add_bounds_restriction(
+            spec_id="S1",
+            facet_index=0,
+            parameter_name="value",
+            base_type="xs:double",
+            ctx=status_only_ctx,
+            min_exclusive=0.0,
+            max_exclusive=100.0
+        )
 
-    await add_attribute_facet(
-        spec_id="S1",
-        location="requirements",
-        attribute_name="Name",
-        ctx=mock_context
-    )
+        # Stored Restriction shape is covered by test_add_bounds_restriction_min_max_inclusive
+        assert result["status"] == "added"
+        assert result["restriction_type"] == "bounds"
+
+    async def test_add_length_restriction_exact(self, status_only_ctx):
+        """Test adding exact length restriction."""
+        result = await R.add_length_restriction(
+            spec_id="S1",
+            facet_index=1,
+            parameter_name="value",
+            base_type="xs:string",
+            ctx=status_only_ctx,
+            length=10
+        )
 
-    await add_length_restriction(
+        assert result["status"] == "added"
+
+
+# XML Export Tests
+@pytest.mark.parametrize(
+    "facet,restriction_fn,restriction_kwargs,xml_substrings",
+    [
+        (
+            "with_property",
+            R.add_enumeration_restriction, {"base_type": "xs:string", "values": ["TRUE", "FALSE"]},
+            ["<xs:enumeration", 'value="TRUE"', 'value="FALSE"']
+        ),
+        (
+            "with_attribute",
+            R.add_pattern_restriction, {"base_type": "xs:string", "pattern": "[A-Z]{2}-[0-9]{4}"},
+            ["<xs:pattern", 'value="[A-Z]{2}-[0-9]{4}"']
+        ),
+        (
+            "with_property",
+            R.add_bounds_restriction,
+            {"base_type": "xs:double", "min_inclusive": 0.1, "max_inclusive": 0.5},
+            [("<xs:minInclusive", "<xs:maxInclusive")]
+        ),
+        (
+            "with_attribute",
+            R.add_length_restriction,
+            {"base_type": "xs:string", "min_length": 1, "max_length": 100},
+            [("<xs:minLength", "<xs:maxLength")]
+        ),
+    ],
+    ids=["enumeration", "pattern", "bounds", "length"]
+)
+async def test_restriction_exports_to_xml(
+    prime_session, facet, restriction_fn, restriction_kwargs, xml_substrings
+):
+    """Test that each restriction type exports to XML."""
+    # Entity in applicability is required by IDS XSD
+    ctx = prime_session(with_entity=True, **{facet: True})
+    await restriction_fn(
         spec_id="S1",
         facet_index=0,
         parameter_name="value",
-        base_type="xs:string",
-        ctx=mock_context,
-        min_length=1,
-        max_length=100
+        ctx=ctx,
+        **restriction_kwargs
     )
 
     # Export to XML (skip XSD validation due to IfcTester namespace bug)
-    result = await export_ids(ctx=mock_context, validate=False)
+    result = await D.export_ids(ctx=ctx, validate=False)
 
     # Verify XML contains restriction elements
     assert result["status"] == "exported"
-    assert "<xs:restriction" in result["xml"]
-    assert "<xs:minLength" in result["xml"] or "<xs:maxLength" in result["xml"]
+    _assert_all_in(result["xml"], ["<xs:restriction", *xml_substrings])
 
 
 # Error Handling Tests
-@pytest.mark.asyncio
-async def test_restriction_spec_not_found(mock_context):
-    """Test that missing specification raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-
-    with pytest.raises(ToolError) as exc_info:
-        await add_enumeration_restriction(
-            spec_id="NonExistent",
-            facet_index=0,
-            parameter_name="value",
-            base_type="xs:string",
-            values=["A"],
-            ctx=mock_context
-        )
-
-    assert "Specification not found" in str(exc_info.value)
-
-
-@pytest.mark.asyncio
-async def test_restriction_invalid_location(mock_context):
-    """Test that invalid location raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
+@pytest.mark.parametrize(
+    "restriction_fn,kwargs,expected_msg",
+    [
+        (
+            R.add_enumeration_restriction,
+            {"spec_id": "S1", "values": ["A", "B"]},  # No facets added
+            "facet index"
+        ),
+        (
+            R.add_enumeration_restriction,
+            {"spec_id": "NonExistent", "values": ["A"]},
+            "Specification not found"
+        ),
+        (
+            R.add_pattern_restriction,
+            {"spec_id": "S1", "pattern": ".*", "location": "invalid"},
+            "Invalid location"
+        ),
+    ],
+    ids=["invalid_facet_index", "spec_not_found", "invalid_location"]
+)
+async def test_restriction_error_paths(prime_session, restriction_fn, kwargs, expected_msg):
+    """Test that restriction tools reject bad facet indexes, specs and locations."""
+    ctx = prime_session()
     with pytest.raises(ToolError) as exc_info:
-        await add_pattern_restriction(
-            spec_id="S1",
+        await restriction_fn(
             facet_index=0,
             parameter_name="value",
             base_type="xs:string",
-            pattern=".*",
-            ctx=mock_context,
-            location="invalid"
+            ctx=ctx,
+            **kwargs
         )
 
-    assert "Invalid location" in str(exc_info.value)
+    assert expected_msg.lower() in str(exc_info.value).lower()
 
 
 # Test applying restrictions to different parameters
-@pytest.mark.asyncio
-async def test_restriction_on_property_set_parameter(mock_context):
+async def test_restriction_on_property_set_parameter(prime_session, get_first_requirement):
     """Test adding restriction to propertySet parameter."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    await add_property_facet(
-        spec_id="S1",
-        location="requirements",
-        property_name=".*",
-        ctx=mock_context,
-        property_set="Pset_Common"
-    )
+    ctx = prime_session(with_property=True)
 
     # Restrict property set name
-    result = await add_pattern_restriction(
+    result = await R.add_pattern_restriction(
         spec_id="S1",
         facet_index=0,
         parameter_name="propertySet",
         base_type="xs:string",
         pattern="Pset_.*",
-        ctx=mock_context
+        ctx=ctx
     )
 
     assert result["status"] == "added"
 
     # Verify restriction applied to propertySet, not value
-    storage = get_session_storage()
-    spec = storage.get(mock_context.session_id).ids_obj.specifications[0]
-    prop = spec.requirements[0]
+    prop = get_first_requirement()
 
     # The restriction should be on propertySet parameter
     assert hasattr(prop, "propertySet") and isinstance(prop.propertySet, ids.Restriction)
@@ -3,17 +3,20 @@
 import pytest
 from ifctester import ids
 from ids_mcp_server.tools.specification import add_specification
-from ids_mcp_server.tools.document import create_ids
+from ids_mcp_server.tools.document import export_ids
 from ids_mcp_server.session.storage import get_session_storage
 from fastmcp.exceptions import ToolError
 
+pytestmark = pytest.mark.usefixtures("fresh_tool_session", "no_leaked_tasks")
+
+# Process-local singleton, so binding it once per module is safe under xdist
+_STORAGE = get_session_storage()
+
+# Each test starts from the empty IDS the fresh_tool_session fixture installs.
+
 
-@pytest.mark.asyncio
 async def test_add_specification_minimal(mock_context):
     """Test adding specification with minimal required fields."""
-    # Create IDS first
-    await create_ids(title="Test IDS", ctx=mock_context)
-
     # Add specification
     result = await add_specification(
         name="Test Specification",
@@ -26,17 +29,13 @@ async def test_add_specification_minimal(mock_context):
     assert result["ifc_versions"] == ["IFC4"]
 
     # Verify in session
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    assert len(session_data.ids_obj.specifications) == 1
-    assert session_data.ids_obj.specifications[0].name == "Test Specification"
+    specs = _STORAGE.get(mock_context.session_id).ids_obj.specifications
+    assert len(specs) == 1
+    assert specs[0].name == "Test Specification"
 
 
-@pytest.mark.asyncio
 async def test_add_specification_with_all_fields(mock_context):
     """Test adding specification with all optional fields."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-
     result = await add_specification(
         name="Complete Specification",
         ifc_versions=["IFC4", "IFC4X3_ADD2"],
@@ -52,9 +51,7 @@ async def test_add_specification_with_all_fields(mock_context):
     assert result["spec_id"] == "S1"
 
     # Verify all fields
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = session_data.ids_obj.specifications[0]
+    spec = _STORAGE.get(mock_context.session_id).ids_obj.specifications[0]
 
     assert spec.name == "Complete Specification"
     assert spec.identifier == "S1"
@@ -64,11 +61,8 @@ async def test_add_specification_with_all_fields(mock_context):
     assert spec.maxOccurs == 5
 
 
-@pytest.mark.asyncio
 async def test_add_specification_normalizes_ifc_versions(mock_context):
     """Test that IFC versions are normalized to uppercase."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-
     result = await add_specification(
         name="Test Spec",
         ifc_versions=["ifc4", "Ifc4x3"],  # lowercase/mixed case
@@ -79,11 +73,8 @@ async def test_add_specification_normalizes_ifc_versions(mock_context):
     assert result["ifc_versions"] == ["IFC4", "IFC4X3_ADD2"]
 
 
-@pytest.mark.asyncio
 async def test_add_specification_invalid_ifc_version(mock_context):
     """Test that invalid IFC versions raise error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-
     with pytest.raises(ToolError) as exc_info:
         await add_specification(
             name="Test Spec",
@@ -94,11 +85,8 @@ async def test_add_specification_invalid_ifc_version(mock_context):
     assert "Invalid IFC version" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_add_specification_multiple_ifc_versions(mock_context):
     """Test adding specification with multiple IFC versions."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-
     result = await add_specification(
         name="Multi-Version Spec",
         ifc_versions=["IFC2X3", "IFC4", "IFC4X3_ADD2"],
@@ -107,17 +95,12 @@ async def test_add_specification_multiple_ifc_versions(mock_context):
 
     assert result["ifc_versions"] == ["IFC2X3", "IFC4", "IFC4X3_ADD2"]
 
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = session_data.ids_obj.specifications[0]
+    spec = _STORAGE.get(mock_context.session_id).ids_obj.specifications[0]
     assert set(spec.ifcVersion) == {"IFC2X3", "IFC4", "IFC4X3_ADD2"}
 
 
-@pytest.mark.asyncio
 async def test_add_specification_unbounded_max_occurs(mock_context):
     """Test adding specification with unbounded max_occurs."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-
     result = await add_specification(
         name="Unbounded Spec",
         ifc_versions=["IFC4"],
@@ -127,17 +110,12 @@ async def test_add_specification_unbounded_max_occurs(mock_context):
 
     assert result["status"] == "added"
 
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = session_data.ids_obj.specifications[0]
+    spec = _STORAGE.get(mock_context.session_id).ids_obj.specifications[0]
     assert spec.maxOccurs == "unbounded"
 
 
-@pytest.mark.asyncio
 async def test_add_multiple_specifications(mock_context):
     """Test adding multiple specifications to same IDS."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-
     # Add first specification
     await add_specification(
         name="Spec 1",
@@ -155,20 +133,14 @@ async def test_add_multiple_specifications(mock_context):
     )
 
     # Verify both exist
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    assert len(session_data.ids_obj.specifications) == 2
-    assert session_data.ids_obj.specifications[0].name == "Spec 1"
-    assert session_data.ids_obj.specifications[1].name == "Spec 2"
+    specs = _STORAGE.get(mock_context.session_id).ids_obj.specifications
+    assert len(specs) == 2
+    assert specs[0].name == "Spec 1"
+    assert specs[1].name == "Spec 2"
 
 
-@pytest.mark.asyncio
 async def test_add_specification_validates_in_export(mock_context):
     """Test that specification validates when exporting IDS."""
-    from ids_mcp_server.tools.document import export_ids
-
-    await create_ids(title="Test IDS", ctx=mock_context)
-
     await add_specification(
         name="Validation Test",
         ifc_versions=["IFC4"],
@@ -176,9 +148,7 @@ async def test_add_specification_validates_in_export(mock_context):
     )
 
     # Add entity to make it valid
-    storage = get_session_storage()
-    session_data = storage.get(mock_context.session_id)
-    spec = session_data.ids_obj.specifications[0]
+    spec = _STORAGE.get(mock_context.session_id).ids_obj.specifications[0]
     spec.applicability.append(ids.Entity(name="IFCWALL"))
 
     # Should export and validate successfully
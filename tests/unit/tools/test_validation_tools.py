@@ -9,8 +9,20 @@ from ids_mcp_server.tools.document import create_ids
 from ids_mcp_server.session.storage import get_session_storage
 from fastmcp.exceptions import ToolError
 
+pytestmark = pytest.mark.usefixtures("fresh_tool_session", "no_leaked_tasks")
+
+# IFC path that never exists; validate_ifc_model rejects it before touching the session
+MISSING_PATH = "/nonexistent/path/to/model.ifc"
+
+
+@pytest.fixture(scope="session")
+def dummy_ifc_file(tmp_path_factory):
+    """Write one unparseable IFC file shared by the report-format tests."""
+    ifc_file = tmp_path_factory.mktemp("ifc") / "test.ifc"
+    ifc_file.write_text("dummy")
+    return ifc_file
+
 
-@pytest.mark.asyncio
 async def test_validate_ids_empty_specs(mock_context):
     """Test that validating IDS with no specifications returns error."""
     await create_ids(title="Test IDS", ctx=mock_context)
@@ -25,25 +37,29 @@ async def test_validate_ids_empty_specs(mock_context):
     assert result["details"]["has_specifications"] is False
 
 
-@pytest.mark.asyncio
-async def test_validate_ids_valid(mock_context):
-    """Test validating a valid IDS document."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Add entity to make it valid
+async def _add_spec(mock_context, i):
+    """Add specification S{i} with an IFCDOOR applicability through the tools."""
+    await add_specification(
+        name=f"Spec {i}", ifc_versions=["IFC4"], ctx=mock_context, identifier=f"S{i}"
+    )
     await add_entity_facet(
-        spec_id="S1",
-        location="applicability",
-        entity_name="IFCWALL",
-        ctx=mock_context
+        spec_id=f"S{i}", location="applicability", entity_name="IFCDOOR", ctx=mock_context
     )
 
+
+@pytest.mark.parametrize("n_specs", [1, 2, 5])
+async def test_validate_ids_valid(mock_context, prime_session, n_specs):
+    """Test validating a valid IDS document with one or more specifications."""
+    # The primed session already holds S1 (IFCWALL)
+    prime_session(with_entity=True)
+    for i in range(2, n_specs + 1):
+        await _add_spec(mock_context, i)
+
     result = await validate_ids(ctx=mock_context)
 
     assert result["valid"] is True
     assert result["errors"] == []
-    assert result["specifications_count"] == 1
+    assert result["specifications_count"] == n_specs
     # Verify enhanced details structure
     assert "details" in result
     assert result["details"]["has_title"] is True
@@ -51,34 +67,9 @@ async def test_validate_ids_valid(mock_context):
     assert result["details"]["xsd_valid"] is True
 
 
-@pytest.mark.asyncio
-async def test_validate_ids_multiple_specs(mock_context):
-    """Test validating IDS with multiple specifications."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-
-    # Add first spec
-    await add_specification(name="Spec 1", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-    await add_entity_facet(spec_id="S1", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
-    # Add second spec
-    await add_specification(name="Spec 2", ifc_versions=["IFC4"], ctx=mock_context, identifier="S2")
-    await add_entity_facet(spec_id="S2", location="applicability", entity_name="IFCDOOR", ctx=mock_context)
-
-    result = await validate_ids(ctx=mock_context)
-
-    assert result["valid"] is True
-    assert result["specifications_count"] == 2
-
-
-@pytest.mark.asyncio
-async def test_validate_ids_validates_xml_structure(mock_context):
+async def test_validate_ids_validates_xml_structure(mock_context, prime_session):
     """Test that validation checks XML structure."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-
-    # Add complete specification
-    await add_entity_facet(spec_id="S1", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
+    prime_session(with_entity=True)
     result = await validate_ids(ctx=mock_context)
 
     # Should serialize to XML and validate against XSD
@@ -87,25 +78,20 @@ async def test_validate_ids_validates_xml_structure(mock_context):
     assert isinstance(result["warnings"], list)
 
 
-@pytest.mark.asyncio
 async def test_validate_ifc_model_file_not_found(mock_context):
     """Test that missing IFC file raises error."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-    await add_entity_facet(spec_id="S1", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
     with pytest.raises(ToolError) as exc_info:
         await validate_ifc_model(
-            ifc_file_path="/nonexistent/path/to/model.ifc",
+            ifc_file_path=MISSING_PATH,
             ctx=mock_context
         )
 
     assert "not found" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_validate_ifc_model_json_format(mock_context, tmp_path):
+async def test_validate_ifc_model_json_format(mock_context, prime_session, tmp_path):
     """Test IFC model validation with JSON report format."""
+    prime_session(with_entity=True)
     # Create a minimal valid IFC file for testing
     ifc_content = """ISO-10303-21;
 HEADER;
@@ -122,11 +108,6 @@ END-ISO-10303-21;
     ifc_file = tmp_path / "test.ifc"
     ifc_file.write_text(ifc_content)
 
-    # Create IDS with specification
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Wall Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-    await add_entity_facet(spec_id="S1", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
     # This should work but may fail if IFC is invalid - that's okay for testing
     try:
         result = await validate_ifc_model(
@@ -151,34 +132,26 @@ END-ISO-10303-21;
         assert "validation error" in str(e).lower() or "ifc" in str(e).lower()
 
 
-@pytest.mark.asyncio
-async def test_validate_ifc_model_invalid_format(mock_context, tmp_path):
-    """Test that invalid IFC file raises error."""
-    ifc_file = tmp_path / "test.ifc"
-    ifc_file.write_text("dummy content")
-
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-    await add_entity_facet(spec_id="S1", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
+@pytest.mark.parametrize("report_format", ["json", "console", "html"])
+async def test_validate_ifc_model_invalid_formats(
+    mock_context, prime_session, dummy_ifc_file, report_format
+):
+    """Test that an unparseable IFC file raises error for every report format."""
+    prime_session(with_entity=True)
     # Invalid IFC file content will raise error when ifcopenshell tries to open it
     with pytest.raises(ToolError) as exc_info:
         await validate_ifc_model(
-            ifc_file_path=str(ifc_file),
+            ifc_file_path=str(dummy_ifc_file),
             ctx=mock_context,
-            report_format="json"
+            report_format=report_format
         )
 
-    assert "IFC validation error" in str(exc_info.value) or "validation error" in str(exc_info.value).lower()
+    assert "validation error" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_validate_ids_returns_warnings(mock_context):
+async def test_validate_ids_returns_warnings(mock_context, prime_session):
     """Test that validation can return warnings."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context, identifier="S1")
-    await add_entity_facet(spec_id="S1", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
+    prime_session(with_entity=True)
     result = await validate_ids(ctx=mock_context)
 
     # Should have warnings key even if empty
@@ -186,55 +159,12 @@ async def test_validate_ids_returns_warnings(mock_context):
     assert isinstance(result["warnings"], list)
 
 
-@pytest.mark.asyncio
-async def test_validate_ifc_model_console_format(mock_context, tmp_path):
-    """Test IFC validation with console report format."""
-    ifc_file = tmp_path / "test.ifc"
-    ifc_file.write_text("dummy")  # Will fail to parse
-
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context)
-    await add_entity_facet(spec_id="Test Spec", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
-    # Console format should work but IFC parsing will fail
-    with pytest.raises(ToolError):
-        await validate_ifc_model(
-            ifc_file_path=str(ifc_file),
-            ctx=mock_context,
-            report_format="console"
-        )
-
-
-@pytest.mark.asyncio
-async def test_validate_ifc_model_html_format(mock_context, tmp_path):
-    """Test IFC validation with HTML report format."""
-    ifc_file = tmp_path / "test.ifc"
-    ifc_file.write_text("dummy")  # Will fail to parse
-
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context)
-    await add_entity_facet(spec_id="Test Spec", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
-    # HTML format should work but IFC parsing will fail
-    with pytest.raises(ToolError):
-        await validate_ifc_model(
-            ifc_file_path=str(ifc_file),
-            ctx=mock_context,
-            report_format="html"
-        )
-
-
-@pytest.mark.asyncio
 async def test_validate_ifc_model_truly_invalid_format(mock_context):
     """Test IFC validation with truly invalid report format on non-existent file."""
-    await create_ids(title="Test IDS", ctx=mock_context)
-    await add_specification(name="Test Spec", ifc_versions=["IFC4"], ctx=mock_context)
-    await add_entity_facet(spec_id="Test Spec", location="applicability", entity_name="IFCWALL", ctx=mock_context)
-
     # Non-existent file should raise FileNotFoundError first
     with pytest.raises(ToolError) as exc_info:
         await validate_ifc_model(
-            ifc_file_path="/nonexistent/path/file.ifc",
+            ifc_file_path=MISSING_PATH,
             ctx=mock_context,
             report_format="json"
         )
@@ -242,7 +172,6 @@ async def test_validate_ifc_model_truly_invalid_format(mock_context):
     assert "file not found" in str(exc_info.value).lower() or "ifc file not found" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
 async def test_validate_ids_with_validation_errors(mock_context):
     """Test validate_ids when IDS has validation errors."""
     from ids_mcp_server.session.storage import get_session_storage
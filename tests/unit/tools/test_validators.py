@@ -62,7 +62,9 @@ class TestValidateSingleEntityInApplicability:
         spec = ids.Specification(name="Test", ifcVersion=["IFC4"])
 
         # Add non-entity facets to applicability
-        spec.applicability.append(ids.Property(baseName="FireRating", propertySet="Pset_WallCommon"))
+        spec.applicability.append(
+            ids.Property(baseName="FireRating", propertySet="Pset_WallCommon")
+        )
         spec.applicability.append(ids.Attribute(name="Name"))
 
         # First entity should still be allowed
@@ -79,29 +81,17 @@ class TestValidateSingleEntityInApplicability:
 class TestValidatePropertySetRequired:
     """Tests for validate_property_set_required function."""
 
-    def test_raises_error_with_none(self):
-        """Test that None property_set raises error."""
+    @pytest.mark.parametrize("bad_value", [None, "", "   ", "\t\n"])
+    def test_raises_error_for_missing_property_set(self, bad_value):
+        """Test that a None, empty or whitespace-only property_set raises error."""
         with pytest.raises(ToolError) as exc_info:
-            validate_property_set_required(None, "FireRating")
+            validate_property_set_required(bad_value, "FireRating")
 
         error_msg = str(exc_info.value)
         assert "property_set" in error_msg.lower()
         assert "required" in error_msg.lower()
         assert "FireRating" in error_msg  # Includes property name
 
-    def test_raises_error_with_empty_string(self):
-        """Test that empty property_set raises error."""
-        with pytest.raises(ToolError):
-            validate_property_set_required("", "FireRating")
-
-    def test_raises_error_with_whitespace_only(self):
-        """Test that whitespace-only property_set raises error."""
-        with pytest.raises(ToolError):
-            validate_property_set_required("   ", "FireRating")
-
-        with pytest.raises(ToolError):
-            validate_property_set_required("\t\n", "FireRating")
-
     def test_passes_with_valid_property_set(self):
         """Test that valid property_set passes validation."""
         # Should not raise
@@ -109,95 +99,74 @@ class TestValidatePropertySetRequired:
         validate_property_set_required("Pset_Common", "CustomProperty")
         validate_property_set_required("MyCustomPropertySet", "MyProperty")
 
-    def test_error_includes_common_property_sets(self):
-        """Test that error message includes helpful examples."""
+    def test_error_includes_property_set_suggestions(self):
+        """Test that error message lists common and custom property sets."""
         with pytest.raises(ToolError) as exc_info:
             validate_property_set_required(None, "FireRating")
 
         error_msg = str(exc_info.value)
-        assert "Pset_WallCommon" in error_msg
-        assert "Pset_DoorCommon" in error_msg
-        assert "Pset_WindowCommon" in error_msg
-        assert "COMMON PROPERTY SETS" in error_msg
-
-    def test_error_includes_custom_options(self):
-        """Test that error message suggests custom property sets."""
-        with pytest.raises(ToolError) as exc_info:
-            validate_property_set_required(None, "CustomProp")
-
-        error_msg = str(exc_info.value)
-        assert "Pset_Common" in error_msg
-        assert "CUSTOM PROPERTY SETS" in error_msg
+        for expected in (
+            "Pset_WallCommon",
+            "Pset_DoorCommon",
+            "Pset_WindowCommon",
+            "Pset_Common",
+            "COMMON PROPERTY SETS",
+            "CUSTOM PROPERTY SETS",
+        ):
+            assert expected in error_msg
+
+
+@pytest.fixture(scope="module")
+def all_facets():
+    """One facet of each IDS facet type, built once per module."""
+    return [
+        ids.Entity(name="IFCWALL"),
+        ids.Property(baseName="FireRating", propertySet="Pset_WallCommon"),
+        ids.Attribute(name="Name"),
+        ids.Classification(value="Ss_25_10_20", system="Uniclass"),
+        ids.Material(value="Concrete"),
+        ids.PartOf(name="IFCSPACE", relation="IFCRELCONTAINEDINSPATIALSTRUCTURE")
+    ]
+
+
+@pytest.fixture(scope="module")
+def paired_facets():
+    """Two entity, two property and two attribute facets, built once per module."""
+    return [
+        ids.Entity(name="IFCWALL"),
+        ids.Property(baseName="FireRating", propertySet="Pset_WallCommon"),
+        ids.Entity(name="IFCDOOR"),
+        ids.Attribute(name="Name"),
+        ids.Property(baseName="LoadBearing", propertySet="Pset_WallCommon"),
+        ids.Attribute(name="Description")
+    ]
 
 
 class TestCountFacetsByType:
     """Tests for count_facets_by_type utility function."""
 
-    def test_counts_entity_facets(self):
-        """Test counting entity facets."""
-        facets = [
-            ids.Entity(name="IFCWALL"),
-            ids.Property(baseName="FireRating", propertySet="Pset_WallCommon"),
-            ids.Entity(name="IFCDOOR"),
-            ids.Attribute(name="Name")
-        ]
-
-        assert count_facets_by_type(facets, ids.Entity) == 2
-
-    def test_counts_property_facets(self):
-        """Test counting property facets."""
-        facets = [
-            ids.Entity(name="IFCWALL"),
-            ids.Property(baseName="FireRating", propertySet="Pset_WallCommon"),
-            ids.Property(baseName="LoadBearing", propertySet="Pset_WallCommon"),
-            ids.Attribute(name="Name")
-        ]
-
-        assert count_facets_by_type(facets, ids.Property) == 2
-
-    def test_counts_attribute_facets(self):
-        """Test counting attribute facets."""
-        facets = [
-            ids.Entity(name="IFCWALL"),
-            ids.Attribute(name="Name"),
-            ids.Attribute(name="Description")
-        ]
-
-        assert count_facets_by_type(facets, ids.Attribute) == 2
-
-    def test_returns_zero_for_missing_type(self):
-        """Test that zero is returned when no facets of type exist."""
-        facets = [
-            ids.Entity(name="IFCWALL"),
-            ids.Property(baseName="FireRating", propertySet="Pset_WallCommon")
-        ]
+    @pytest.mark.parametrize("facet_type", [ids.Entity, ids.Property, ids.Attribute])
+    def test_counts_facets_of_type(self, paired_facets, facet_type):
+        """Test counting entity, property and attribute facets among mixed types."""
+        assert count_facets_by_type(paired_facets, facet_type) == 2
 
-        assert count_facets_by_type(facets, ids.Classification) == 0
-        assert count_facets_by_type(facets, ids.Material) == 0
-        assert count_facets_by_type(facets, ids.PartOf) == 0
+    @pytest.mark.parametrize("facet_type", [ids.Classification, ids.Material, ids.PartOf])
+    def test_returns_zero_for_missing_type(self, paired_facets, facet_type):
+        """Test that zero is returned when no facets of type exist."""
+        assert count_facets_by_type(paired_facets, facet_type) == 0
 
     def test_handles_empty_list(self):
         """Test that empty list returns zero."""
         assert count_facets_by_type([], ids.Entity) == 0
         assert count_facets_by_type([], ids.Property) == 0
 
-    def test_counts_all_facet_types(self):
-        """Test counting all different facet types."""
-        facets = [
-            ids.Entity(name="IFCWALL"),
-            ids.Property(baseName="FireRating", propertySet="Pset_WallCommon"),
-            ids.Attribute(name="Name"),
-            ids.Classification(value="Ss_25_10_20", system="Uniclass"),
-            ids.Material(value="Concrete"),
-            ids.PartOf(name="IFCSPACE", relation="IFCRELCONTAINEDINSPATIALSTRUCTURE")
-        ]
-
-        assert count_facets_by_type(facets, ids.Entity) == 1
-        assert count_facets_by_type(facets, ids.Property) == 1
-        assert count_facets_by_type(facets, ids.Attribute) == 1
-        assert count_facets_by_type(facets, ids.Classification) == 1
-        assert count_facets_by_type(facets, ids.Material) == 1
-        assert count_facets_by_type(facets, ids.PartOf) == 1
+    @pytest.mark.parametrize(
+        "facet_type",
+        [ids.Entity, ids.Property, ids.Attribute, ids.Classification, ids.Material, ids.PartOf]
+    )
+    def test_counts_all_facet_types(self, all_facets, facet_type):
+        """Test counting each facet type in a list holding one of every type."""
+        assert count_facets_by_type(all_facets, facet_type) == 1
 
 
 class TestValidatorsIntegration:
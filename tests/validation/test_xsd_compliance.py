@@ -12,48 +12,54 @@ from ifctester import ids
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 VALID_IDS_DIR = FIXTURES_DIR / "valid_ids_files"
 INVALID_IDS_DIR = FIXTURES_DIR / "invalid_ids_files"
+VALID_FILES = sorted(VALID_IDS_DIR.glob("*.ids"))
 
 
-@pytest.mark.asyncio
-async def test_valid_ids_files_pass_xsd_validation():
-    """Test that valid IDS fixture files pass XSD validation.
+@pytest.fixture(scope="session")
+def parsed_valid_fixtures():
+    """Parse and export every valid fixture once: {path: (ids_obj, xml_string, has_restrictions)}.
 
-    Note: Due to IfcTester 0.8.3 namespace bug, files with restrictions cannot
-    be validated with XSD. Those files are tested without XSD validation.
+    The cached objects are shared by all tests, so tests must not mutate them.
     """
-    valid_files = list(VALID_IDS_DIR.glob("*.ids"))
+    cache = {}
+    for path in VALID_FILES:
+        ids_obj = ids.open(str(path))
+        xml_string = ids_obj.to_string()
+        cache[path] = (ids_obj, xml_string, "<xs:restriction" in xml_string)
+    return cache
 
-    assert len(valid_files) > 0, "No valid IDS fixture files found"
 
-    for ids_file in valid_files:
-        # Load and validate with IfcTester
-        ids_obj = ids.open(str(ids_file))
+def test_valid_fixture_files_present():
+    """Guard against the parametrized fixture tests silently collecting nothing."""
+    assert len(VALID_FILES) > 0, "No valid IDS fixture files found"
 
-        # Export to XML
-        xml_string = ids_obj.to_string()
 
-        # Check if file has restrictions (these fail XSD validation due to IfcTester bug)
-        has_restrictions = "<xs:restriction" in xml_string
+@pytest.mark.parametrize("ids_file", VALID_FILES, ids=lambda p: p.name)
+def test_valid_ids_files_pass_xsd_validation(parsed_valid_fixtures, ids_file):
+    """Test that valid IDS fixture files pass XSD validation.
 
-        if not has_restrictions:
-            # Can safely do XSD validation for files without restrictions
-            validated_ids = ids.from_string(xml_string, validate=True)
-            assert validated_ids is not None, f"File {ids_file.name} failed XSD validation"
-        else:
-            # Skip XSD validation for files with restrictions (known IfcTester bug)
-            # Just verify we can reload without validation
-            validated_ids = ids.from_string(xml_string, validate=False)
-            assert validated_ids is not None, f"File {ids_file.name} failed to reload"
+    Note: Due to IfcTester 0.8.3 namespace bug, files with restrictions cannot
+    be validated with XSD. Those files are tested without XSD validation.
+    """
+    ids_obj, xml_string, has_restrictions = parsed_valid_fixtures[ids_file]
 
-        assert validated_ids.info.get("title"), f"File {ids_file.name} has no title"
+    # Files with restrictions fail XSD validation due to IfcTester bug
+    if not has_restrictions:
+        # Can safely do XSD validation for files without restrictions
+        validated_ids = ids.from_string(xml_string, validate=True)
+        assert validated_ids is not None, f"File {ids_file.name} failed XSD validation"
+    else:
+        # Skip XSD validation for files with restrictions (known IfcTester bug)
+        # Just verify we can reload without validation
+        validated_ids = ids.from_string(xml_string, validate=False)
+        assert validated_ids is not None, f"File {ids_file.name} failed to reload"
 
+    assert validated_ids.info.get("title"), f"File {ids_file.name} has no title"
 
-@pytest.mark.asyncio
-async def test_simple_wall_requirement_structure():
-    """Test the structure of simple_wall_requirement.ids fixture."""
-    ids_file = VALID_IDS_DIR / "simple_wall_requirement.ids"
 
-    ids_obj = ids.open(str(ids_file))
+def test_simple_wall_requirement_structure(parsed_valid_fixtures):
+    """Test the structure of simple_wall_requirement.ids fixture."""
+    ids_obj, _, _ = parsed_valid_fixtures[VALID_IDS_DIR / "simple_wall_requirement.ids"]
 
     # Verify structure
     assert ids_obj.info.get("title") == "Simple Wall Requirement"
@@ -80,19 +86,13 @@ async def test_simple_wall_requirement_structure():
 # Our validation logic is tested in test_validation_tools.py instead.
 
 
-@pytest.mark.asyncio
-async def test_round_trip_validation():
+def test_round_trip_validation(parsed_valid_fixtures):
     """Test that valid IDS can be loaded, exported, and re-validated.
 
     Uses simple_wall_requirement.ids (no restrictions) to avoid IfcTester bug.
     """
-    ids_file = VALID_IDS_DIR / "simple_wall_requirement.ids"
-
-    # Load
-    ids_obj = ids.open(str(ids_file))
-
-    # Export
-    xml_string = ids_obj.to_string()
+    # Loaded and exported once by the fixture
+    ids_obj, xml_string, _ = parsed_valid_fixtures[VALID_IDS_DIR / "simple_wall_requirement.ids"]
 
     # Re-load and validate (safe because no restrictions)
     reloaded_ids = ids.from_string(xml_string, validate=True)
@@ -109,34 +109,25 @@ async def test_round_trip_validation():
     assert reloaded_ids_2 is not None
 
 
-@pytest.mark.asyncio
-async def test_all_valid_fixtures_round_trip():
+@pytest.mark.parametrize("ids_file", VALID_FILES, ids=lambda p: p.name)
+def test_all_valid_fixtures_round_trip(parsed_valid_fixtures, ids_file):
     """Test round-trip (load -> export -> load) for all valid fixtures.
 
     Note: XSD validation skipped for files with restrictions due to IfcTester bug.
     """
-    valid_files = list(VALID_IDS_DIR.glob("*.ids"))
-
-    assert len(valid_files) > 0, "No valid IDS fixture files found"
+    # Load from the raw file text (may fail XSD validation for files with restrictions)
+    ids_obj = ids.from_string(ids_file.read_text(encoding="utf-8"), validate=False)
 
-    for ids_file in valid_files:
-        # Load (may fail XSD validation for files with restrictions)
-        import xml.etree.ElementTree as ET
-        tree = ET.parse(str(ids_file))
-        xml_string_initial = ET.tostring(tree.getroot(), encoding='unicode')
-
-        ids_obj = ids.from_string(xml_string_initial, validate=False)
-
-        # Export
-        xml_string = ids_obj.to_string()
+    # Export
+    xml_string = ids_obj.to_string()
 
-        # Check if has restrictions
-        has_restrictions = "<xs:restriction" in xml_string
+    # Restriction detection is cached per fixture file
+    _, _, has_restrictions = parsed_valid_fixtures[ids_file]
 
-        # Re-load (with or without validation based on restrictions)
-        reloaded_ids = ids.from_string(xml_string, validate=not has_restrictions)
+    # Re-load (with or without validation based on restrictions)
+    reloaded_ids = ids.from_string(xml_string, validate=not has_restrictions)
 
-        # Basic structure checks
-        assert reloaded_ids is not None, f"{ids_file.name}: Failed round-trip"
-        assert len(reloaded_ids.specifications) == len(ids_obj.specifications), \
-            f"{ids_file.name}: Specification count mismatch after round-trip"
+    # Basic structure checks
+    assert reloaded_ids is not None, f"{ids_file.name}: Failed round-trip"
+    assert len(reloaded_ids.specifications) == len(ids_obj.specifications), \
+        f"{ids_file.name}: Specification count mismatch after round-trip"